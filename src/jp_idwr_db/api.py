@@ -6,16 +6,109 @@ simple data access with flexible filtering capabilities.
 
 from __future__ import annotations
 
+import functools
 import logging
+from dataclasses import dataclass
 from typing import Literal
 
 import polars as pl
 
-from .datasets import load_dataset
+from .datasets import _data_path, scan_dataset
 
 logger = logging.getLogger(__name__)
 
 
+def _disease_pattern(disease: str | list[str]) -> str:
+    """Combine disease filter terms into one case-insensitive regex alternation.
+
+    Each term is a raw regular expression matched anywhere in the disease
+    name, so ``"Tuberculosis|Measles"`` or ``"influenza.*"`` work as patterns.
+    Terms are neither escaped nor lowercased; ``(?i)`` handles case.
+    """
+    diseases = [disease] if isinstance(disease, str) else disease
+    return "(?i)(" + "|".join(diseases) + ")"
+
+
+@dataclass(frozen=True)
+class _Catalog:
+    """Lightweight summary of the unified dataset used to reject empty queries.
+
+    Attributes:
+        schema: Column schema of the unified dataset.
+        diseases: Lowercased distinct disease names.
+        prefectures: Distinct prefecture names.
+        min_year: Earliest year with data.
+        max_year: Latest year with data.
+    """
+
+    schema: pl.Schema
+    diseases: tuple[str, ...]
+    prefectures: frozenset[str]
+    min_year: int
+    max_year: int
+
+    def may_match(
+        self,
+        disease: str | list[str] | None,
+        prefecture: str | list[str] | None,
+        year: int | tuple[int, int] | None,
+    ) -> bool:
+        """Return False when the filters cannot match any row of the dataset."""
+        if disease is not None:
+            # Same expression as the get_data filter, so the two cannot disagree
+            names = pl.Series(self.diseases, dtype=pl.String)
+            if not names.str.contains(_disease_pattern(disease)).any():
+                return False
+
+        if prefecture is not None:
+            prefectures = [prefecture] if isinstance(prefecture, str) else prefecture
+            if self.prefectures.isdisjoint(prefectures):
+                return False
+
+        if year is not None:
+            start_year, end_year = year if isinstance(year, tuple) else (year, year)
+            if end_year < self.min_year or start_year > self.max_year:
+                return False
+
+        return True
+
+
+@functools.lru_cache(maxsize=8)
+def _catalog(path: str, size: int, mtime_ns: int) -> _Catalog:
+    """Scan the distinct prefectures, diseases and year range of a parquet file.
+
+    Results are cached per file path and version (size and modification
+    time), so the scan runs once per file version and a re-download or data
+    update in the same process is picked up. Only the disease, prefecture and
+    year columns are read.
+    """
+    lf = pl.scan_parquet(path)
+    summary = lf.select(
+        pl.col("disease").str.to_lowercase().unique().implode(),
+        pl.col("prefecture").unique().implode(),
+        pl.col("year").min().alias("min_year"),
+        pl.col("year").max().alias("max_year"),
+    ).collect()
+    return _Catalog(
+        schema=lf.collect_schema(),
+        diseases=tuple(d for d in summary["disease"][0] if d is not None),
+        prefectures=frozenset(p for p in summary["prefecture"][0] if p is not None),
+        min_year=int(summary["min_year"][0]),
+        max_year=int(summary["max_year"][0]),
+    )
+
+
+def _load_catalog() -> _Catalog | None:
+    """Return the cached unified dataset catalog, or None if it is unavailable."""
+    try:
+        path = _data_path("unified")
+        stat = path.stat()
+        return _catalog(str(path), stat.st_size, stat.st_mtime_ns)
+    except Exception:
+        logger.debug("Unified dataset catalog unavailable", exc_info=True)
+        return None
+
+
 def get_data(
     disease: str | list[str] | None = None,
     prefecture: str | list[str] | None = None,
@@ -30,7 +123,8 @@ def get_data(
     optional filters.
 
     Args:
-        disease: Filter by disease name(s). Case-insensitive partial matching.
+        disease: Filter by disease name(s). Case-insensitive partial matching;
+            each term is a regular expression.
             Examples: "Influenza", ["COVID-19", "Influenza"], "RS virus"
         prefecture: Filter by prefecture name(s).
             Examples: "Tokyo", ["Tokyo", "Osaka"]
@@ -80,22 +174,52 @@ def get_data(
         ...     source="all"
         ... )
     """
-    # Load unified dataset (cached locally, downloaded from releases on demand).
+    # Skip the full load when the filters cannot match anything in the catalog.
+    catalog = _load_catalog()
+    if catalog is not None and not catalog.may_match(disease, prefecture, year):
+        return pl.DataFrame(schema=catalog.schema)
+
+    # Scan unified dataset lazily (cached locally, downloaded from releases on demand)
+    # so every filter is pushed down into a single parquet read. The scan is lazy,
+    # so read errors only surface on collect, which must stay inside the fallback.
+    apply_filters = functools.partial(
+        _filter_dataset, disease=disease, prefecture=prefecture, year=year, week=week, source=source
+    )
     try:
-        df = load_dataset("unified")
+        return apply_filters(scan_dataset("unified")).collect()
     except Exception:
         logger.warning("Failed to load unified dataset, falling back to bullet dataset")
-        try:
-            df = load_dataset("bullet")
-        except Exception:
-            logger.warning("Failed to load bullet dataset, returning empty DataFrame")
-            df = pl.DataFrame()
+    try:
+        return apply_filters(scan_dataset("bullet")).collect()
+    except Exception:
+        logger.warning("Failed to load bullet dataset, returning empty DataFrame")
+        return pl.DataFrame()
 
-    if df.height == 0:
-        return df
 
-    # Apply filters
-    if source != "all" and "source" in df.columns:
+def _filter_dataset(
+    lf: pl.LazyFrame,
+    *,
+    disease: str | list[str] | None,
+    prefecture: str | list[str] | None,
+    year: int | tuple[int, int] | None,
+    week: int | tuple[int, int] | None,
+    source: Literal["confirmed", "sentinel", "all"],
+) -> pl.LazyFrame:
+    """Apply the `get_data` filters to a lazy dataset scan.
+
+    Args:
+        lf: Lazy scan of a dataset.
+        disease: Disease filter term(s), as in `get_data`.
+        prefecture: Prefecture name(s) to keep.
+        year: Single year or inclusive (start, end) range.
+        week: Single week or inclusive (start, end) range.
+        source: Data source filter.
+
+    Returns:
+        The filtered LazyFrame.
+    """
+    columns = lf.collect_schema().names()
+    if source != "all" and "source" in columns:
         source_map = {
             "confirmed": ["Confirmed cases", "All-case reporting"],
             "sentinel": "Sentinel surveillance",
@@ -103,39 +227,32 @@ def get_data(
         if source in source_map:
             target = source_map[source]
             if isinstance(target, list):
-                df = df.filter(pl.col("source").is_in(target))
+                lf = lf.filter(pl.col("source").is_in(target))
             else:
-                df = df.filter(pl.col("source") == target)
+                lf = lf.filter(pl.col("source") == target)
 
     if disease is not None:
-        diseases = [disease] if isinstance(disease, str) else disease
-        # Case-insensitive partial matching
-        disease_filter = pl.lit(False)
-        for d in diseases:
-            disease_filter = disease_filter | pl.col("disease").str.to_lowercase().str.contains(
-                d.lower()
-            )
-        df = df.filter(disease_filter)
+        lf = lf.filter(pl.col("disease").str.contains(_disease_pattern(disease)))
 
     if prefecture is not None:
         prefectures = [prefecture] if isinstance(prefecture, str) else prefecture
-        df = df.filter(pl.col("prefecture").is_in(prefectures))
+        lf = lf.filter(pl.col("prefecture").is_in(prefectures))
 
     if year is not None:
         if isinstance(year, tuple):
             start_year, end_year = year
-            df = df.filter((pl.col("year") >= start_year) & (pl.col("year") <= end_year))
+            lf = lf.filter((pl.col("year") >= start_year) & (pl.col("year") <= end_year))
         else:
-            df = df.filter(pl.col("year") == year)
+            lf = lf.filter(pl.col("year") == year)
 
     if week is not None:
         if isinstance(week, tuple):
             start_week, end_week = week
-            df = df.filter((pl.col("week") >= start_week) & (pl.col("week") <= end_week))
+            lf = lf.filter((pl.col("week") >= start_week) & (pl.col("week") <= end_week))
         else:
-            df = df.filter(pl.col("week") == week)
+            lf = lf.filter(pl.col("week") == week)
 
-    return df
+    return lf
 
 
 def list_diseases(source: Literal["confirmed", "sentinel", "all"] = "all") -> list[str]:
@@ -170,6 +287,9 @@ def list_prefectures() -> list[str]:
         >>> print(prefectures[:3])
         ['Aichi', 'Akita', 'Aomori']
     """
+    catalog = _load_catalog()
+    if catalog is not None:
+        return sorted(catalog.prefectures)
     df = get_data()
     if df.height == 0:
         return []
@@ -5,12 +5,19 @@ This module provides a global configuration system for controlling package behav
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+import functools
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 from platformdirs import user_cache_dir
 
 
+@functools.lru_cache(maxsize=1)
+def _default_cache_dir() -> Path:
+    """Resolve the platform cache directory once per process."""
+    return Path(user_cache_dir("jp_idwr_db"))
+
+
 @dataclass(frozen=True)
 class Config:
     """Global configuration for jp_idwr_db package.
@@ -23,14 +30,15 @@ class Config:
         retries: Number of retry attempts for failed requests.
     """
 
-    cache_dir: Path = Path(user_cache_dir("jp_idwr_db"))
+    cache_dir: Path = field(default_factory=_default_cache_dir)
     rate_limit_per_minute: int = 20
     user_agent: str = "jp_idwr_db/0.2.5 (+https://github.com/AlFontal/jp-idwr-db)"
     timeout_seconds: float = 30.0
     retries: int = 3
 
 
-_CONFIG = Config()
+# Created on first use so importing the package does not probe platform directories.
+_CONFIG: Config | None = None
 
 
 def get_config() -> Config:
@@ -39,6 +47,9 @@ def get_config() -> Config:
     Returns:
         The current Config instance.
     """
+    global _CONFIG  # noqa: PLW0603
+    if _CONFIG is None:
+        _CONFIG = Config()
     return _CONFIG
 
 
@@ -56,5 +67,5 @@ def configure(**kwargs: object) -> Config:
         >>> jp.configure(rate_limit_per_minute=10)
     """
     global _CONFIG  # noqa: PLW0603
-    _CONFIG = replace(_CONFIG, **kwargs)  # type: ignore[arg-type]
+    _CONFIG = replace(get_config(), **kwargs)  # type: ignore[arg-type]
     return _CONFIG
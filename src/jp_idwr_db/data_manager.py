@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import os
@@ -40,6 +41,16 @@ def get_cache_dir() -> Path:
     return Path(user_cache_dir(PACKAGE_NAME))
 
 
+@functools.lru_cache(maxsize=1)
+def _installed_data_version() -> str:
+    """Return the data version tag matching the installed package (looked up once)."""
+    try:
+        pkg_version = package_version("jp-idwr-db")
+    except PackageNotFoundError:
+        pkg_version = "0.0.0"
+    return pkg_version if pkg_version.startswith("v") else f"v{pkg_version}"
+
+
 def _resolve_data_version(version: str | None) -> str:
     """Resolve data version from explicit arg, env var, or package version."""
     if version:
@@ -47,11 +58,7 @@ def _resolve_data_version(version: str | None) -> str:
     env_version = os.getenv("JPINFECT_DATA_VERSION")
     if env_version:
         return env_version
-    try:
-        pkg_version = package_version("jp-idwr-db")
-    except PackageNotFoundError:
-        pkg_version = "0.0.0"
-    return pkg_version if pkg_version.startswith("v") else f"v{pkg_version}"
+    return _installed_data_version()
 
 
 def _resolve_base_url(version: str) -> str:
@@ -77,6 +77,38 @@ def load_dataset(
     return pl.read_parquet(path)
 
 
+def scan_dataset(
+    name: DatasetName | Literal["sex_prefecture", "place_prefecture", "unified", "sentinel"],
+    *,
+    version: str | None = None,
+    force_download: bool = False,
+) -> pl.LazyFrame:
+    """Lazily scan a dataset from local cache (downloaded from release assets when needed).
+
+    Unlike :func:`load_dataset`, nothing is read until the returned LazyFrame is
+    collected, so filters and column selections are pushed down into the parquet scan.
+
+    Args:
+        name: Dataset name (same values and aliases as :func:`load_dataset`).
+        version: Optional data release version.
+        force_download: Force re-download of release assets.
+
+    Returns:
+        LazyFrame over the requested dataset.
+
+    Example:
+        >>> from jp_idwr_db.datasets import scan_dataset
+        >>> tokyo = scan_dataset("unified").filter(pl.col("prefecture") == "Tokyo").collect()
+    """
+    if name == "sex":
+        name = "sex_prefecture"
+    elif name == "place":
+        name = "place_prefecture"
+
+    path = _data_path(name, version=version, force=force_download)
+    return pl.scan_parquet(path)
+
+
 def load_prefecture_en(*, version: str | None = None, force_download: bool = False) -> list[str]:
     """Load the list of English prefecture names.
 
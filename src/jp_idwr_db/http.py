@@ -6,10 +6,16 @@ with built-in disk caching, ETag support, and polite rate limiting.
 
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
+import logging
+import re
+import shutil
+import threading
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -17,6 +23,10 @@ import httpx
 
 from .config import Config
 
+logger = logging.getLogger(__name__)
+
+_RE_MAX_AGE = re.compile(r"\bmax-age=(\d+)")
+
 
 @dataclass
 class CacheEntry:
@@ -114,33 +124,68 @@ class RateLimiter:
         """
         self.interval = 60.0 / max(per_minute, 1)
         self._last_time: float | None = None
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
         """Wait if necessary to respect the rate limit.
 
         This method blocks until enough time has passed since the last request.
-        On the first call, it does not block.
+        On the first call, it does not block. It is safe to share one limiter
+        between threads: each caller reserves the next free slot under a lock
+        and sleeps outside it.
         """
-        if self._last_time is None:
-            self._last_time = time.monotonic()
-            return
-        elapsed = time.monotonic() - self._last_time
-        if elapsed < self.interval:
-            time.sleep(self.interval - elapsed)
-        self._last_time = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            if self._last_time is None:
+                self._last_time = now
+                return
+            slot = max(now, self._last_time + self.interval)
+            self._last_time = slot
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# Long-lived clients keyed by (user agent, timeout); closed at interpreter exit
+_clients: dict[tuple[str, float], httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def _close_clients() -> None:
+    """Close every shared client and release its pooled connections."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(_close_clients)
 
 
 def _build_client(config: Config) -> httpx.Client:
-    """Build an HTTP client with configured timeout and headers.
+    """Get an HTTP client with configured timeout and headers.
+
+    The client is shared for the lifetime of the process so that keep-alive
+    connections to the NIID servers are reused across requests instead of
+    paying a new TCP and TLS handshake per file. Callers must not close it;
+    all shared clients are closed at interpreter exit.
 
     Args:
         config: Configuration object containing user agent and timeout settings.
 
     Returns:
-        Configured httpx.Client instance.
+        Shared httpx.Client instance.
     """
-    headers = {"User-Agent": config.user_agent}
-    return httpx.Client(timeout=config.timeout_seconds, headers=headers, follow_redirects=True)
+    key = (config.user_agent, config.timeout_seconds)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            headers = {"User-Agent": config.user_agent}
+            client = httpx.Client(
+                timeout=config.timeout_seconds, headers=headers, follow_redirects=True
+            )
+            _clients[key] = client
+    return client
 
 
 def cached_get(url: str, config: Config) -> Path:
@@ -170,62 +215,166 @@ def cached_get(url: str, config: Config) -> Path:
     if "last_modified" in meta:
         headers["If-Modified-Since"] = meta["last_modified"]
 
-    with _build_client(config) as client:
-        response = client.get(url, headers=headers)
-        if response.status_code == 304:
-            # Not modified, return cached file
-            if entry.path.exists():
-                return entry.path
-            # Cache missing despite 304, re-download
-            response = client.get(url)
-        response.raise_for_status()
-        entry.path.write_bytes(response.content)
-        new_meta = {
-            "etag": response.headers.get("etag", ""),
-            "last_modified": response.headers.get("last-modified", ""),
-            "url": url,
-        }
-        cache.write_meta(url, new_meta)
-        return entry.path
+    client = _build_client(config)
+    response = client.get(url, headers=headers)
+    if response.status_code == 304:
+        # Not modified, return cached file
+        if entry.path.exists():
+            return entry.path
+        # Cache missing despite 304, re-download
+        response = client.get(url)
+    response.raise_for_status()
+    entry.path.write_bytes(response.content)
+    new_meta = {
+        "etag": response.headers.get("etag", ""),
+        "last_modified": response.headers.get("last-modified", ""),
+        "url": url,
+    }
+    cache.write_meta(url, new_meta)
+    return entry.path
+
+
+def _head_ttl(headers: httpx.Headers) -> int:
+    """Get how many seconds a HEAD response may be reused, per Cache-Control.
+
+    Args:
+        headers: Response headers.
+
+    Returns:
+        The ``max-age`` in seconds, or 0 if the response must not be reused.
+    """
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control or "no-cache" in cache_control:
+        return 0
+    match = _RE_MAX_AGE.search(cache_control)
+    return int(match.group(1)) if match else 0
 
 
 def cached_head(url: str, config: Config) -> httpx.Response:
     """Perform a HEAD request to check if a URL exists.
 
+    Responses that carry a ``Cache-Control: max-age`` are kept on disk until
+    they expire, so repeated availability checks across runs skip the round
+    trip. Responses without an explicit lifetime are never reused.
+
     Args:
         url: URL to check.
-        config: Configuration object for HTTP settings.
+        config: Configuration object for cache directory and HTTP settings.
 
     Returns:
-        HTTP Response object from the HEAD request.
+        HTTP Response object from the HEAD request (or its cached copy).
     """
-    with _build_client(config) as client:
-        return client.head(url)
+    cache = DiskCache(config.cache_dir / "head")
+    meta = cache.read_meta(url)
+    if meta is not None and float(meta["expires"]) > time.time():
+        return httpx.Response(
+            int(meta["status_code"]),
+            headers=json.loads(meta["headers"]),
+            request=httpx.Request("HEAD", url),
+        )
+
+    response = _build_client(config).head(url)
+    ttl = _head_ttl(response.headers)
+    if ttl > 0:
+        cache.write_meta(
+            url,
+            {
+                "url": url,
+                "status_code": str(response.status_code),
+                "headers": json.dumps(response.headers.multi_items()),
+                "expires": str(time.time() + ttl),
+            },
+        )
+    return response
+
+
+def _is_current_copy(dest: Path, source: Path) -> bool:
+    """Check whether dest already holds the current contents of source.
+
+    A copy is current when it has the same size and is not older than the
+    cache file, which is only rewritten when the server sends new content.
 
+    Args:
+        dest: Destination file.
+        source: Cached file.
 
-def download_urls(urls: Iterable[str], dest_dir: Path, config: Config) -> list[Path]:
+    Returns:
+        True if copying source to dest can be skipped.
+    """
+    try:
+        dest_stat = dest.stat()
+    except FileNotFoundError:
+        return False
+    source_stat = source.stat()
+    return (
+        dest_stat.st_size == source_stat.st_size
+        and dest_stat.st_mtime_ns >= source_stat.st_mtime_ns
+    )
+
+
+def download_urls(
+    urls: Iterable[str],
+    dest_dir: Path,
+    config: Config,
+    *,
+    skip_missing: bool = False,
+    filenames: Mapping[str, str] | None = None,
+    limiter: RateLimiter | None = None,
+    max_workers: int = 1,
+    overwrite: bool = False,
+) -> list[Path]:
     """Download multiple URLs with rate limiting and caching.
 
     Args:
         urls: Iterable of URLs to download.
         dest_dir: Destination directory for downloaded files.
         config: Configuration object for cache, rate limit, and HTTP settings.
+        skip_missing: If True, URLs answering 404 are skipped instead of raising.
+        filenames: Optional URL -> destination filename overrides. URLs not
+            listed keep the last component of their path.
+        limiter: Rate limiter to share with other batches. Defaults to a new
+            limiter at ``config.rate_limit_per_minute``.
+        max_workers: Maximum number of downloads in flight at once. Requests
+            are still started no faster than the limiter allows.
+        overwrite: If True, always rewrite destination files from the cache,
+            even when they look current.
 
     Returns:
-        List of paths to downloaded files.
+        List of paths to downloaded files in URL order (missing URLs are omitted).
+
+    Raises:
+        httpx.HTTPStatusError: If a download fails (other than a skipped 404).
 
     Note:
         Files are first downloaded to cache, then copied to dest_dir with
-        original filenames. This ensures idempotent downloads across different
-        destination directories while sharing a common cache.
+        original (or overridden) filenames. This ensures idempotent downloads across different
+        destination directories while sharing a common cache. Cached files
+        revalidate with conditional requests, and when the server answers
+        304 an up-to-date destination copy is left untouched (unless
+        ``overwrite`` is set).
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
-    limiter = RateLimiter(config.rate_limit_per_minute)
-    downloaded: list[Path] = []
-    for url in urls:
+    limiter = limiter or RateLimiter(config.rate_limit_per_minute)
+
+    def fetch(url: str) -> Path | None:
         limiter.wait()
-        cache_path = cached_get(url, config)
-        dest_path = dest_dir / Path(url).name
-        dest_path.write_bytes(cache_path.read_bytes())
-        downloaded.append(dest_path)
-    return downloaded
+        try:
+            cache_path = cached_get(url, config)
+        except httpx.HTTPStatusError as exc:
+            if skip_missing and exc.response.status_code == 404:
+                logger.debug(f"Skipping missing file: {url}")
+                return None
+            raise
+        name = filenames.get(url) if filenames else None
+        dest_path = dest_dir / (name or Path(url).name)
+        if overwrite or not _is_current_copy(dest_path, cache_path):
+            shutil.copyfile(cache_path, dest_path)
+        return dest_path
+
+    url_list = list(urls)
+    if max_workers > 1 and len(url_list) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(url_list))) as executor:
+            results = list(executor.map(fetch, url_list))
+    else:
+        results = [fetch(url) for url in url_list]
+    return [path for path in results if path is not None]
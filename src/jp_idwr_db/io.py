@@ -15,17 +15,25 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import functools
+import hashlib
+import json
 import logging
+import os
 import re
+import sys
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, cast
 
+import fastexcel
 import polars as pl
 from platformdirs import user_cache_dir
 
+from . import __version__
 from .config import get_config
-from .http import download_urls
+from .http import RateLimiter, download_urls
 from .types import DatasetName
 from .urls import url_bullet, url_confirmed, url_sentinel
 
@@ -73,6 +81,53 @@ _DISEASE_NAME_MAPPINGS = {
     "Avian influenza H5N1": "Avian influenza H5N1",
     "Avian influenza H7N9": "Avian influenza H7N9",
 }
+# Intern keys and values so lookups of interned names hit the identity fast path
+_DISEASE_NAME_MAPPINGS = {sys.intern(k): sys.intern(v) for k, v in _DISEASE_NAME_MAPPINGS.items()}
+
+# Precompiled patterns for the per-cell and per-file parsing hot paths
+# Leading header line(s) and/or an Excel-generated "...N" name, stripped in one pass
+_RE_HEADER_NOISE = re.compile(r"^(?:.*[\r\n]+)?(?:\.\.\.[0-9]+$)?")
+_RE_WS = re.compile(r"\s+")
+_RE_BILINGUAL = re.compile(r"[\uFF08(]([^\)\uFF09]+)[)\uFF09]")
+_RE_MALFORMED = re.compile(r"^[^\(]*\)\s*\((.+)$")
+_RE_YEAR = re.compile(r"(19|20)\d{2}")
+_RE_WEEK = re.compile(r"(?:-)?(\d{2})|zensu(\d{2})")
+_RE_DUP_COL = re.compile(r"_[0-9]+$")
+_RE_SENTINEL_EN_WEEK = re.compile(r"(\d+)(?:st|nd|rd|th)\s+week,\s*(\d{4})", re.IGNORECASE)
+_RE_TEITEN_WEEK = re.compile(r"teiten(?:rui)?(\d{2})", re.IGNORECASE)
+_RE_CJK = re.compile(r"[\u3040-\u309f\u30a0-\u30ff\u4e00-\u9fff]")
+_RE_CSV_FILE = re.compile(r"\.csv\Z")
+
+# Category keywords in match order; the first one found in a header cell wins
+_CATEGORY_KEYWORDS = ("total", "male", "female", "japan", "others", "unknown")
+
+# Read every cell as text: headers are parsed as strings and counts are cast
+# later anyway, so calamine's per-column type (and date) inference is wasted work
+_SHEET_READ_OPTIONS = {"dtypes": "string"}
+
+# Weekly downloads in flight at once; request starts are still rate limited
+_MAX_DOWNLOAD_WORKERS = 4
+
+# Confirmed-cases workbook names by dataset type (None matches either)
+_SYU_PATTERNS: dict[str | None, re.Pattern[str]] = {
+    "sex": re.compile(r"(Syu_01_1|01_1)\.(xls|xlsx)$"),
+    "place": re.compile(r"(Syu_02_1|02_1)\.(xls|xlsx)$"),
+    None: re.compile(r"Syu_0[12]_1\.(xls|xlsx)$"),
+}
+
+# Common full-width letters and characters seen in the data
+_FULLWIDTH_MAP = {
+    "\uff29": "I",
+    "\uff4e": "n",
+    "\uff21": "A",
+    "\uff25": "E",
+    "\uff2f": "O",
+    "\u3000": " ",  # Full-width space
+}
+_FULLWIDTH_TRANS = str.maketrans(_FULLWIDTH_MAP)
+# Null bytes (1999-2000 files) are dropped; line breaks and tabs become spaces
+_CELL_CONTROL_TRANS = str.maketrans({"\x00": None, "\r": " ", "\n": " ", "\t": " "})
+_BULLET_HEADER_TRANS = str.maketrans({"\uff29": "I", "\uff08": "(", "\uff09": ")"})
 
 # Track original -> cleaned disease names (populated during data reading)
 _disease_name_tracker: dict[str, str] = {}
@@ -88,29 +143,37 @@ def _col_rename_bullet(names: list[str]) -> list[str]:
         names: Raw column names from CSV header.
 
     Returns:
-        List of cleaned column names.
+        List of cleaned column names (names that clean to nothing are dropped).
     """
-    cleaned: list[str] = []
-    for raw_name in names:
-        # Remove newlines that appear in the middle of names
-        clean = re.sub(r"^.*[\r\n]+", "", str(raw_name))
-        # Remove Excel-generated column names like "...1", "...2"
-        clean = re.sub(r"^\.\.\.[0-9]+$", "", clean)
-        # Replace full-width characters with ASCII equivalents
-        clean = clean.replace("\uff29", "I")
-        clean = clean.replace("\uff08", "(").replace("\uff09", ")")
-        # Collapse multiple spaces
-        clean = re.sub(r"\s+", " ", clean).strip()
-        # Remove wrapping parentheses only (not parentheses that are part of the name)
-        # Only strip if the entire string is wrapped: "(Something)" -> "Something"
-        # Don't strip if parentheses are part of content: "Word (detail)" stays as is
-        if clean.startswith("(") and clean.endswith(")") and clean.count("(") == 1:
-            clean = clean[1:-1].strip()
-        if clean:
-            cleaned.append(clean)
-    return cleaned
+    return [clean for raw_name in names if (clean := _clean_bullet_header(str(raw_name)))]
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_bullet_header(raw_name: str) -> str:
+    """Clean a single bullet CSV column name (memoized; headers repeat weekly).
 
+    Args:
+        raw_name: Raw column name from the CSV header.
 
+    Returns:
+        Cleaned column name, or an empty string if nothing remains.
+    """
+    # Remove newlines that appear in the middle of names and
+    # Excel-generated column names like "...1", "...2"
+    clean = _RE_HEADER_NOISE.sub("", raw_name, count=1)
+    # Replace full-width characters with ASCII equivalents
+    clean = clean.translate(_BULLET_HEADER_TRANS)
+    # Collapse multiple spaces
+    clean = _RE_WS.sub(" ", clean).strip()
+    # Remove wrapping parentheses only (not parentheses that are part of the name)
+    # Only strip if the entire string is wrapped: "(Something)" -> "Something"
+    # Don't strip if parentheses are part of content: "Word (detail)" stays as is
+    if clean.startswith("(") and clean.endswith(")") and clean.count("(") == 1:
+        clean = clean[1:-1].strip()
+    return clean
+
+
+@functools.lru_cache(maxsize=8192)
 def _clean_cell_text(text: str | None) -> str | None:
     """Clean text from Excel cells (handles null bytes, extracts English).
 
@@ -118,6 +181,9 @@ def _clean_cell_text(text: str | None) -> str | None:
     Japanese text followed by English in parentheses - we extract the English.
     Handles both half-width and full-width parentheses.
 
+    Results are memoized: header and prefecture cells come from a small,
+    highly repetitive vocabulary.
+
     Args:
         text: Raw cell text.
 
@@ -126,15 +192,13 @@ def _clean_cell_text(text: str | None) -> str | None:
     """
     if not text:
         return None
-    # Remove null bytes (issue in older data)
-    clean = text.replace("\x00", "")
-    # Normalize whitespace
-    clean = clean.replace("\r", " ").replace("\n", " ").replace("\t", " ")
+    # Remove null bytes (issue in older data) and normalize whitespace
+    clean = text.translate(_CELL_CONTROL_TRANS)
 
     # Extract English text from bilingual cells like "日本語 (English)".
     # Support both half-width and full-width parentheses.
     # Use findall to get all matches, then take the LAST one (which is usually the English)
-    matches = re.findall(r"[\uFF08(]([^\)\uFF09]+)[)\uFF09]", clean)
+    matches = _RE_BILINGUAL.findall(clean)
     if matches:
         # Take the last match (English is typically at the end)
         english = matches[-1].strip()
@@ -156,22 +220,40 @@ def _normalize_fullwidth(text: str) -> str:
     Returns:
         Text with full-width ASCII normalized to half-width.
     """
-    # Common full-width letters and characters seen in the data
-    replacements = {
-        "\uff29": "I",
-        "\uff4e": "n",
-        "\uff21": "A",
-        "\uff25": "E",
-        "\uff2f": "O",
-        "\u3000": " ",  # Full-width space
-    }
-    for fw, hw in replacements.items():
-        text = text.replace(fw, hw)
-    return text
+    return text.translate(_FULLWIDTH_TRANS)
 
 
+def _clean_cell_text_expr(expr: pl.Expr) -> pl.Expr:
+    """Vectorized equivalent of `_clean_cell_text` for a string column.
+
+    Args:
+        expr: Expression yielding raw cell text.
+
+    Returns:
+        Expression yielding cleaned text (null for null or empty cells).
+    """
+    fw_from = list(_FULLWIDTH_MAP)
+    fw_to = list(_FULLWIDTH_MAP.values())
+    text = (
+        expr.cast(pl.Utf8)
+        .str.replace_all("\x00", "", literal=True)
+        .str.replace_all(r"[\r\n\t]", " ")
+    )
+    # Last bilingual "(English)" group, or null when the cell has none
+    english = (
+        text.str.extract_all(_RE_BILINGUAL.pattern)
+        .list.last()
+        .str.extract(_RE_BILINGUAL.pattern, 1)
+        .str.strip_chars()
+        .str.replace_many(fw_from, fw_to)
+    )
+    fallback = text.str.replace_many(fw_from, fw_to).str.strip_chars()
+    return pl.when(text == "").then(None).otherwise(pl.coalesce(english, fallback))
+
+
+@functools.lru_cache(maxsize=8192)
 def _normalize_disease_name(name: str) -> str:
-    """Normalize disease names for consistency.
+    """Normalize disease names for consistency (memoized).
 
     Fixes common issues:
     - Malformed parentheses (e.g., "H5N1) (Avian influenza H5N1")
@@ -185,10 +267,10 @@ def _normalize_disease_name(name: str) -> str:
         Normalized disease name.
     """
     # Normalize spacing first to keep mapping keys stable.
-    name = re.sub(r"\s+", " ", name).strip()
+    name = _RE_WS.sub(" ", name).strip()
 
     # Fix malformed parentheses like "H5N1) (Avian influenza H5N1" -> "Avian influenza H5N1"
-    malformed_match = re.match(r"^[^\(]*\)\s*\((.+)$", name)
+    malformed_match = _RE_MALFORMED.match(name)
     if malformed_match:
         name = malformed_match.group(1).strip()
 
@@ -197,11 +279,51 @@ def _normalize_disease_name(name: str) -> str:
         name = name + (")" * (name.count("(") - name.count(")")))
 
     # Apply known disease name mappings for duplicates/variants
-    name = _DISEASE_NAME_MAPPINGS.get(name, name)
+    name = _DISEASE_NAME_MAPPINGS.get(sys.intern(name), name)
 
     return name
 
 
+def _normalize_disease_name_expr(expr: pl.Expr) -> pl.Expr:
+    """Vectorized equivalent of `_normalize_disease_name` for a string column.
+
+    Args:
+        expr: Expression yielding raw disease names.
+
+    Returns:
+        Expression yielding normalized disease names.
+    """
+    name = expr.str.replace_all(_RE_WS.pattern, " ").str.strip_chars()
+    malformed = name.str.extract(_RE_MALFORMED.pattern, 1).str.strip_chars()
+    name = pl.coalesce(malformed, name)
+    # Repair historical headers where trailing ')' is dropped
+    opened = name.str.count_matches("(", literal=True).cast(pl.Int32)
+    closed = name.str.count_matches(")", literal=True).cast(pl.Int32)
+    missing = opened - closed
+    name = (
+        pl.when(missing > 0)
+        .then(name + pl.lit(")").repeat_by(missing.clip(lower_bound=0)).list.join(""))
+        .otherwise(name)
+    )
+    return name.replace(_DISEASE_NAME_MAPPINGS)
+
+
+def _disease_name_pairs(pairs: pl.DataFrame) -> dict[str, str]:
+    """Collect raw-to-normalized disease name pairs, first occurrence first.
+
+    Args:
+        pairs: Frame whose two columns hold raw and normalized names.
+
+    Returns:
+        Mapping of non-empty raw names to their normalized names.
+    """
+    return {
+        raw_name: normalized
+        for raw_name, normalized in pairs.unique(maintain_order=True).iter_rows()
+        if raw_name
+    }
+
+
 def _resolve_headers(
     cols: list[str | None], row2: list[str | None], row3: list[str | None]
 ) -> list[str]:
@@ -222,52 +344,98 @@ def _resolve_headers(
         List of standardized column names.
     """
     headers = ["prefecture"]  # First column is always prefecture
+    seen = {"prefecture"}
+    suffix_counts: dict[str, int] = {}
     current_disease = "Unknown"
 
     for i in range(1, len(cols)):
         r2 = _clean_cell_text(row2[i])
-        r3 = _clean_cell_text(row3[i])
 
         # Update current disease if row2 has a value (merged cells span multiple columns)
         if r2:
             current_disease = r2
 
-        # Filter out Japanese-only category text
-        # If r3 contains Japanese characters, it's likely a note/modifier, not a category
-        if r3 and any(
-            "\u3040" <= c <= "\u309f" or "\u30a0" <= c <= "\u30ff" or "\u4e00" <= c <= "\u9fff"
-            for c in r3
-        ):
-            r3 = None  # Treat as empty, will default to "total"
-
-        # Normalize category name
-        cat = r3 if r3 else "total"
-        cat_lower = cat.lower()
-        if "total" in cat_lower:
-            cat = "total"
-        elif "male" in cat_lower:
-            cat = "male"
-        elif "female" in cat_lower:
-            cat = "female"
-        elif "japan" in cat_lower:
-            cat = "japan"
-        elif "others" in cat_lower:
-            cat = "others"
-        elif "unknown" in cat_lower:
-            cat = "unknown"
+        cat = _header_category(row3[i])
 
         # Create header and handle duplicates
         base_header = f"{current_disease}||{cat}"
         new_header = base_header
-        count = 1
-        while new_header in headers:
-            new_header = f"{base_header}_{count}"
-            count += 1
+        if new_header in seen:
+            count = suffix_counts.get(base_header, 0) + 1
+            while (new_header := f"{base_header}_{count}") in seen:
+                count += 1
+            suffix_counts[base_header] = count
+        seen.add(new_header)
         headers.append(new_header)
 
     return headers
 
 
+@functools.lru_cache(maxsize=1024)
+def _header_category(cell: str | None) -> str:
+    """Normalize a category header cell (Total, Male, ...) to its short name.
+
+    Args:
+        cell: Raw category cell from the header row.
+
+    Returns:
+        The first matching keyword from `_CATEGORY_KEYWORDS`, the cleaned text
+        if none match, or "total" for empty and Japanese-only cells.
+    """
+    cat = _clean_cell_text(cell)
+    # Japanese text here is a note/modifier, not a category; treat it as empty
+    if not cat or _RE_CJK.search(cat):
+        return "total"
+    cat_lower = cat.lower()
+    return next((keyword for keyword in _CATEGORY_KEYWORDS if keyword in cat_lower), cat)
+
+
+def _load_raw_sheets(file_path: Path, sheet_range: Iterable[int]) -> dict[int, pl.DataFrame]:
+    """Load worksheets without headers, opening the workbook only once.
+
+    All sheets are decoded in a single read, so the sheet count comes for free
+    and indices past the end of the workbook are simply ignored. If that read
+    fails, sheets are retried one at a time so that a single corrupt sheet
+    does not discard the rest of the file.
+
+    Args:
+        file_path: Path to the Excel file.
+        sheet_range: Sheet indices to read (1-based).
+
+    Returns:
+        Mapping of sheet index to raw DataFrame.
+    """
+    path_str = str(file_path)
+    try:
+        sheets = list(
+            pl.read_excel(
+                path_str, sheet_id=0, has_header=False, read_options=_SHEET_READ_OPTIONS
+            ).values()
+        )
+    except Exception:
+        logger.debug(f"Batched read of {file_path.name} failed; reading sheets individually")
+    else:
+        return {sheet: sheets[sheet - 1] for sheet in sheet_range if 1 <= sheet <= len(sheets)}
+
+    try:
+        n_sheets = len(fastexcel.read_excel(path_str).sheet_names)
+    except Exception:
+        logger.exception(f"Error opening workbook {file_path.name}")
+        return {}
+
+    raw_sheets: dict[int, pl.DataFrame] = {}
+    for sheet in sheet_range:
+        if not 1 <= sheet <= n_sheets:
+            continue
+        try:
+            raw_sheets[sheet] = pl.read_excel(
+                path_str, sheet_id=sheet, has_header=False, read_options=_SHEET_READ_OPTIONS
+            )
+        except Exception:
+            logger.exception(f"Error reading sheet {sheet} from {file_path.name}")
+    return raw_sheets
+
+
 def _read_excel_sheets(
     file_path: Path, sheet_range: Iterable[int]
 ) -> list[tuple[int, pl.DataFrame]]:
@@ -291,52 +459,41 @@ def _read_excel_sheets(
         - Row 4+: Data rows
     """
     frames: list[tuple[int, pl.DataFrame]] = []
-    path_str = str(file_path)
+    raw_sheets = _load_raw_sheets(file_path, sheet_range)
 
-    for sheet in sheet_range:
+    for sheet, df_raw in raw_sheets.items():
         try:
-            # Read without header to manually parse the structure
-            df_raw = pl.read_excel(path_str, sheet_id=sheet, has_header=False)
-
-            # Handle edge case where read_excel returns dict instead of DataFrame
-            if isinstance(df_raw, dict):  # type: ignore[unreachable]
-                if len(df_raw) >= 1:  # type: ignore[unreachable]
-                    df_raw = next(iter(df_raw.values()))
-                else:
-                    continue
-
             # Skip sheets with insufficient rows
             if df_raw.height < 5:
                 continue
 
-            # Extract header rows
-            row2 = [str(x) if x is not None else None for x in df_raw.row(2)]
-            row3 = [str(x) if x is not None else None for x in df_raw.row(3)]
+            # Extract header rows (cells are read as text, so already str or None)
+            row2, row3 = (list(row) for row in df_raw.slice(2, 2).rows())
 
             # Validate that this looks like a data sheet (row3 should contain "total")
-            row3_clean = [_clean_cell_text(x) for x in row3]
-            if not any("total" in str(x).lower() for x in row3_clean if x):
+            if not any("total" in (_clean_cell_text(x) or "").lower() for x in row3):
                 logger.debug(f"Skipping sheet {sheet}: No 'total' category in header row")
                 continue
 
             # Resolve header names
             headers = _resolve_headers(list(df_raw.columns), row2, row3)
 
-            # Extract data rows (skip first 4 rows of headers/metadata)
-            data_df = df_raw.slice(4)
-            data_df.columns = headers
+            # Extract data rows (skip first 4 rows of headers/metadata) as one lazy
+            # query: rename by position, drop duplicate-header artifacts (like
+            # "Disease||total_1") and clean prefectures without intermediate frames
+            lf = df_raw.lazy().slice(4)
+            lf = lf.select(
+                pl.col(raw).alias(header)
+                for raw, header in zip(df_raw.columns, headers, strict=True)
+                if not ("||" in header and _RE_DUP_COL.search(header))
+            )
 
             # Clean prefecture column and remove aggregate rows
-            if "prefecture" in data_df.columns:
-                data_df = data_df.with_columns(
-                    pl.col("prefecture").map_elements(
-                        lambda x: _clean_cell_text(str(x)), return_dtype=pl.Utf8
-                    )
-                )
-                # Remove "Total" aggregate rows
-                data_df = data_df.filter(
-                    ~pl.col("prefecture").str.to_lowercase().str.contains("total")
-                )
+            if "prefecture" in headers:
+                lf = lf.with_columns(
+                    _clean_cell_text_expr(pl.col("prefecture")).alias("prefecture")
+                ).filter(~pl.col("prefecture").str.to_lowercase().str.contains("total"))
+            data_df = lf.collect()
 
             if not data_df.is_empty():
                 frames.append((sheet, data_df))
@@ -348,6 +505,20 @@ def _read_excel_sheets(
     return frames
 
 
+def _list_files(path: Path, pattern: re.Pattern[str]) -> list[Path]:
+    """List files in a directory whose names match a pattern.
+
+    Args:
+        path: Directory to scan.
+        pattern: Regex searched against each entry name.
+
+    Returns:
+        Matching paths in directory order.
+    """
+    with os.scandir(path) as entries:
+        return [Path(entry.path) for entry in entries if pattern.search(entry.name)]
+
+
 def _infer_year_from_path(path: Path) -> int | None:
     """Extract year from filename.
 
@@ -357,10 +528,7 @@ def _infer_year_from_path(path: Path) -> int | None:
     Returns:
         Four-digit year or None if not found.
     """
-    match = re.search(r"(19|20)\d{2}", path.name)
-    if not match:
-        return None
-    return int(match.group(0))
+    return _year_week_from_name(path.name)[0]
 
 
 def _extract_year_week(path: Path) -> tuple[int | None, int | None]:
@@ -372,8 +540,14 @@ def _extract_year_week(path: Path) -> tuple[int | None, int | None]:
     Returns:
         Tuple of (year, week) or (None, None) if not found.
     """
-    year_match = re.search(r"(19|20)\d{2}", path.name)
-    week_match = re.search(r"(?:-)?(\d{2})|zensu(\d{2})", path.name)
+    return _year_week_from_name(path.name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _year_week_from_name(name: str) -> tuple[int | None, int | None]:
+    """Parse year and week from a file name (memoized, names repeat across calls)."""
+    year_match = _RE_YEAR.search(name)
+    week_match = _RE_WEEK.search(name)
     year = int(year_match.group(0)) if year_match else None
     week = None
     if week_match:
@@ -417,20 +591,27 @@ def _combine_confirmed_frames(
     Returns:
         Combined DataFrame with year and week columns.
     """
-    combined: list[pl.DataFrame] = []
-    for sheet, frame in frames:
-        week = sheet + week_offset
-        enhanced = frame.with_columns([pl.lit(year).alias("year"), pl.lit(week).alias("week")])
-        combined.append(enhanced)
-
-    if not combined:
+    if not frames:
         return pl.DataFrame()
 
-    return pl.concat(combined, how="diagonal_relaxed")
+    # Sheets may lack some disease columns, so concatenate diagonally and let
+    # polars null-fill missing columns and supercast mismatched dtypes
+    return pl.concat(
+        [
+            frame.with_columns(
+                pl.lit(year, dtype=pl.Int32).alias("year"),
+                pl.lit(sheet + week_offset, dtype=pl.Int32).alias("week"),
+            )
+            for sheet, frame in frames
+        ],
+        how="diagonal_relaxed",
+        rechunk=False,
+    )
 
 
+@functools.lru_cache(maxsize=4096)
 def _iso_week_date(year: int, week: int) -> dt.date | None:
-    """Convert ISO year and week to a date (last day of week = Sunday).
+    """Convert ISO year and week to a date (last day of week = Sunday, memoized).
 
     Args:
         year: ISO year.
@@ -445,6 +626,49 @@ def _iso_week_date(year: int, week: int) -> dt.date | None:
         return None
 
 
+def _iso_week_date_expr(year: pl.Expr, week: pl.Expr) -> pl.Expr:
+    """Vectorized equivalent of `_iso_week_date`.
+
+    ISO week 1 is the week containing January 4th, so its Monday is found by
+    stepping back from that date; December 28th always falls in the last week.
+
+    Args:
+        year: Expression yielding the ISO year.
+        week: Expression yielding the ISO week number.
+
+    Returns:
+        Expression yielding the Sunday of that week, or null if invalid.
+    """
+    jan4 = pl.date(year, 1, 4)
+    week1_monday = jan4 - pl.duration(days=jan4.dt.weekday() - 1)
+    sunday = week1_monday + pl.duration(weeks=week - 1, days=6)
+    n_weeks = pl.date(year, 12, 28).dt.week()
+    return pl.when(week.is_between(1, n_weeks)).then(sunday).otherwise(None)
+
+
+def _read_confirmed_file(file_path: Path) -> pl.DataFrame | None:
+    """Read all weekly sheets of one confirmed-cases workbook.
+
+    Args:
+        file_path: Path to the Excel file.
+
+    Returns:
+        Combined wide DataFrame with year and week columns, or None if the
+        year cannot be inferred from the filename.
+    """
+    year = _infer_year_from_path(file_path) or 0
+    if year == 0:
+        logger.warning(f"Could not infer year from {file_path.name}, skipping")
+        return None
+
+    sheet_range = _sheet_range_for_year(year)
+    excel_frames = _read_excel_sheets(file_path, sheet_range)
+
+    # 1999 data starts at week 14 (sheet 2), so offset=12 makes sheet 2 -> week 14
+    week_offset = 12 if year == 1999 else -1
+    return _combine_confirmed_frames(excel_frames, year, week_offset=week_offset)
+
+
 def _read_confirmed_pl(
     path: Path,
     *,
@@ -452,6 +676,9 @@ def _read_confirmed_pl(
 ) -> pl.DataFrame:
     """Read confirmed cases data from Excel file(s).
 
+    Disease names seen while parsing are added to the global tracker (see
+    `get_disease_name_mappings`), keeping the first normalization recorded.
+
     Args:
         path: Path to file or directory containing Excel files.
         type: Dataset type ("sex" or "place"), used for filename pattern matching.
@@ -460,94 +687,166 @@ def _read_confirmed_pl(
         DataFrame in long format with columns: prefecture, year, week, date,
         disease, category, count.
     """
+    df, names = _parse_confirmed_pl(path, type=type)
+    for raw_name, normalized in names.items():
+        _disease_name_tracker.setdefault(raw_name, normalized)
+    return df
+
+
+def _parse_confirmed_pl(
+    path: Path,
+    *,
+    type: DatasetName | None = None,
+) -> tuple[pl.DataFrame, dict[str, str]]:
+    """Parse confirmed cases data from Excel file(s) without touching global state.
+
+    Args:
+        path: Path to file or directory containing Excel files.
+        type: Dataset type ("sex" or "place"), used for filename pattern matching.
+
+    Returns:
+        Tuple of the long-format DataFrame (as `_read_confirmed_pl`) and the
+        raw-to-normalized disease names of its columns.
+    """
     # If path is a directory, find the appropriate file(s)
     if path.is_dir():
-        if type == "sex":
-            pattern = re.compile(r"(Syu_01_1|01_1)\.(xls|xlsx)$")
-        elif type == "place":
-            pattern = re.compile(r"(Syu_02_1|02_1)\.(xls|xlsx)$")
-        else:
-            pattern = re.compile(r"Syu_0[12]_1\.(xls|xlsx)$")
-        files = [p for p in path.iterdir() if pattern.search(p.name)]
+        pattern = _SYU_PATTERNS.get(type, _SYU_PATTERNS[None])
+        files = _list_files(path, pattern)
     else:
         files = [path]
 
-    frames: list[pl.DataFrame] = []
-    for file_path in sorted(files):
-        year = _infer_year_from_path(file_path) or 0
-        if year == 0:
-            logger.warning(f"Could not infer year from {file_path.name}, skipping")
-            continue
-
-        sheet_range = _sheet_range_for_year(year)
-        excel_frames = _read_excel_sheets(file_path, sheet_range)
-
-        # 1999 data starts at week 14 (sheet 2), so offset=12 makes sheet 2 -> week 14
-        week_offset = 12 if year == 1999 else -1
-        combined = _combine_confirmed_frames(excel_frames, year, week_offset=week_offset)
-        frames.append(combined)
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(_read_confirmed_file, sorted(files))
+        frames = [frame for frame in results if frame is not None]
 
     if not frames:
-        return pl.DataFrame()
-
-    df = pl.concat(frames, how="diagonal_relaxed")
+        return pl.DataFrame(), {}
 
-    # Calculate date column from year and week
-    if "date" not in df.columns and "year" in df.columns and "week" in df.columns:
-        df = df.with_columns(
-            pl.struct(["year", "week"])
-            .map_elements(
-                lambda x: _iso_week_date(x["year"], x["week"]),
-                return_dtype=pl.Date,
-            )
-            .alias("date")
+    if len(frames) == 1:
+        # A single workbook (the usual case) needs no concatenation at all
+        df = frames[0]
+    else:
+        # Files from the same header layout line up already; only align diagonally
+        # (null-padding missing disease columns) when their column sets differ
+        first_columns = frames[0].columns
+        same_layout = all(frame.columns == first_columns for frame in frames[1:])
+        how: Literal["vertical_relaxed", "diagonal_relaxed"] = (
+            "vertical_relaxed" if same_layout else "diagonal_relaxed"
         )
+        df = pl.concat(frames, how=how, rechunk=False)
+    columns = df.columns
 
-    # Remove duplicate columns (artifacts from duplicate headers like "Disease||total_1")
-    cols_to_drop = [c for c in df.columns if re.search(r"_[0-9]+$", c) and "||" in c]
-    if cols_to_drop:
-        df = df.drop(cols_to_drop)
+    # Build the reshaping as one lazy query so Polars can fuse the steps
+    lf = df.lazy()
+
+    # Calculate date column from year and week
+    if "date" not in columns and "year" in columns and "week" in columns:
+        lf = lf.with_columns(_iso_week_date_expr(pl.col("year"), pl.col("week")).alias("date"))
+        columns = [*columns, "date"]
 
     # Melt from wide to long format
-    id_vars = [c for c in df.columns if c in {"prefecture", "year", "week", "date"}]
-    value_vars = [c for c in df.columns if "||" in c]
+    id_vars = [c for c in columns if c in {"prefecture", "year", "week", "date"}]
+    value_vars = [c for c in columns if "||" in c]
 
     if not value_vars:
-        return df
+        return lf.collect(), {}
+
+    # Split "Disease||Category" and normalize disease names once per column,
+    # then map the unpivoted variable column through the results
+    category_by_col: dict[str, str] = {}
+    disease_by_col: dict[str, str] = {}
+    names: dict[str, str] = {}
+    for col in value_vars:
+        disease_raw, _, category = col.partition("||")
+        category_by_col[col] = category
+        disease_by_col[col] = _normalize_disease_name(disease_raw) if disease_raw else disease_raw
+        if disease_raw:
+            names.setdefault(disease_raw, disease_by_col[col])
+
+    long_df = (
+        lf.unpivot(index=id_vars, on=value_vars, variable_name="variable", value_name="count")
+        .with_columns(
+            pl.col("variable")
+            .replace_strict(category_by_col, return_dtype=pl.Utf8)
+            .alias("category"),
+            pl.col("variable")
+            .replace_strict(disease_by_col, return_dtype=pl.Utf8)
+            .alias("disease"),
+            # Clean count column (convert to int, treating errors as 0)
+            pl.col("count").cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int64),
+            # Add source column
+            pl.lit("Confirmed cases").alias("source"),
+        )
+        .drop("variable")
+        .collect()
+    )
+    return long_df, names
 
-    long_df = df.unpivot(index=id_vars, on=value_vars, variable_name="variable", value_name="count")
 
-    # Split "Disease||Category" into separate columns
-    long_df = long_df.with_columns(
-        [
-            pl.col("variable").str.split("||").list.get(0).alias("disease_raw"),
-            pl.col("variable").str.split("||").list.get(1).alias("category"),
-        ]
-    ).drop("variable")
-
-    # Normalize disease names and track mappings
-    disease_mappings = {}
-    for raw_name in long_df["disease_raw"].unique():
-        if raw_name:
-            normalized = _normalize_disease_name(raw_name)
-            disease_mappings[raw_name] = normalized
-            # Update global tracker
-            if raw_name not in _disease_name_tracker:
-                _disease_name_tracker[raw_name] = normalized
-
-    long_df = long_df.with_columns(
-        pl.col("disease_raw").replace(disease_mappings).alias("disease")
-    ).drop("disease_raw")
-
-    # Clean count column (convert to int, treating errors as 0)
-    long_df = long_df.with_columns(
-        pl.col("count").cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int64)
-    )
+def _scan_bullet_file(p: Path, *, year: int | None = None) -> pl.LazyFrame | None:
+    """Build a lazy long-format query for a single bullet CSV file.
+
+    Only the header is read here; the data is parsed when the query is
+    collected.
+
+    Args:
+        p: Path to the CSV file.
+        year: Year to assign (if None, inferred from filename).
 
-    # Add source column
-    long_df = long_df.with_columns(pl.lit("Confirmed cases").alias("source"))
+    Returns:
+        LazyFrame in long format, or None if the file has no data columns.
+    """
+    # Skip metadata rows (0-2), header is row 3, subheader is row 4
+    lf = pl.scan_csv(p, skip_rows=3, infer_schema_length=0)
 
-    return long_df
+    # Drop the subheader row (first data row contains "Current week", etc.)
+    lf = lf.slice(1)
+
+    # Keep only valid columns (exclude cumulative columns with auto-generated names)
+    to_select = [
+        c
+        for c in lf.collect_schema().names()
+        if c in {"Prefecture", "prefecture"} or not c.startswith(("_duplicated_", "field_"))
+    ]
+
+    # Clean column names, standardizing the prefecture column name
+    new_names: dict[str, str] = {}
+    for c in to_select:
+        name = _clean_bullet_header(c) or c
+        new_names[c] = "prefecture" if name == "Prefecture" else name
+
+    # Project and rename in a single step
+    lf = lf.select(pl.col(c).alias(n) for c, n in new_names.items())
+
+    # Unpivot to long format
+    value_vars = [c for c in new_names.values() if c != "prefecture"]
+    if not value_vars:
+        return None
+
+    lf = lf.unpivot(
+        index=["prefecture"], on=value_vars, variable_name="disease", value_name="count"
+    )
+
+    # Add year and week columns
+    file_year, file_week = _extract_year_week(p)
+    y = year or file_year
+    w = file_week
+
+    if y is not None:
+        lf = lf.with_columns(pl.lit(y).alias("year"))
+    if w is not None:
+        lf = lf.with_columns(pl.lit(w).alias("week"))
+
+    # Calculate date
+    if y is not None and w is not None:
+        lf = lf.with_columns(_iso_week_date_expr(pl.col("year"), pl.col("week")).alias("date"))
+
+    return lf.with_columns(
+        # Clean count column
+        pl.col("count").cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int64),
+        # Add source column
+        pl.lit("Confirmed cases").alias("source"),
+    )
 
 
 def _read_bullet_pl(
@@ -568,94 +867,42 @@ def _read_bullet_pl(
         disease, count.
     """
     # Find CSV files
-    files = list(path.glob("*.csv")) if path.is_dir() else [path]
+    files = _list_files(path, _RE_CSV_FILE) if path.is_dir() else [path]
 
     # Filter by week if specified
     if week is not None:
         week_set = {int(w) for w in week}
         files = [p for p in files if (_extract_year_week(p)[1] in week_set)]
 
-    frames: list[pl.DataFrame] = []
+    # Build one lazy query per file, then collect them together so Polars can
+    # parse and reshape the files in parallel
+    queries: list[tuple[Path, pl.LazyFrame]] = []
     for p in sorted(files):
         try:
-            # Skip metadata rows (0-2), header is row 3, subheader is row 4
-            df_raw = pl.read_csv(p, skip_rows=3, infer_schema_length=0)
-
-            # Drop the subheader row (first data row contains "Current week", etc.)
-            if df_raw.height > 0:
-                df_raw = df_raw.slice(1)
-
-            # Keep only valid columns (exclude cumulative columns with auto-generated names)
-            to_select = [
-                c
-                for c in df_raw.columns
-                if c in {"Prefecture", "prefecture"}
-                or not (c.startswith("_duplicated_") or c.startswith("field_"))
-            ]
-            df_raw = df_raw.select(to_select)
-
-            # Clean column names
-            new_names = {}
-            for c in df_raw.columns:
-                clean_name = _col_rename_bullet([c])
-                new_names[c] = clean_name[0] if clean_name else c
-
-            df_raw = df_raw.rename(new_names)
-
-            # Standardize prefecture column name
-            if "Prefecture" in df_raw.columns:
-                df_raw = df_raw.rename({"Prefecture": "prefecture"})
-
-            # Unpivot to long format
-            value_vars = [c for c in df_raw.columns if c != "prefecture"]
-            if not value_vars:
-                continue
-
-            long_df = df_raw.unpivot(
-                index=["prefecture"], on=value_vars, variable_name="disease", value_name="count"
-            )
-
-            # Add year and week columns
-            file_year, file_week = _extract_year_week(p)
-            y = year or file_year
-            w = file_week
-
-            if y is not None:
-                long_df = long_df.with_columns(pl.lit(y).alias("year"))
-            if w is not None:
-                long_df = long_df.with_columns(pl.lit(w).alias("week"))
-
-            # Calculate date
-            if "year" in long_df.columns and "week" in long_df.columns:
-                long_df = long_df.with_columns(
-                    pl.struct(["year", "week"])
-                    .map_elements(
-                        lambda x: _iso_week_date(int(x["year"]), int(x["week"])),
-                        return_dtype=pl.Date,
-                    )
-                    .alias("date")
-                )
-
-            # Clean count column
-            long_df = long_df.with_columns(
-                pl.col("count").cast(pl.Float64, strict=False).fill_null(0).cast(pl.Int64)
-            )
-
-            # Add source column
-            long_df = long_df.with_columns(pl.lit("Confirmed cases").alias("source"))
-
-            frames.append(long_df)
-
+            query = _scan_bullet_file(p, year=year)
         except Exception:
             logger.exception(f"Failed to parse bullet file: {p.name}")
             continue
+        if query is not None:
+            queries.append((p, query))
+
+    try:
+        frames = pl.collect_all([query for _, query in queries])
+    except Exception:
+        # Fall back to collecting file by file so one bad file is skipped, not all
+        frames = []
+        for p, query in queries:
+            try:
+                frames.append(query.collect())
+            except Exception:
+                logger.exception(f"Failed to parse bullet file: {p.name}")
 
     if not frames:
         return pl.DataFrame()
-    return pl.concat(frames, how="vertical")
+    return pl.concat(frames, how="vertical", rechunk=False)
 
 
-def _read_sentinel_pl(  # noqa: PLR0915
+def _read_sentinel_pl(
     path: Path,
     *,
     year: int | None = None,
@@ -673,7 +920,7 @@ def _read_sentinel_pl(  # noqa: PLR0915
         disease, count, per_sentinel, source.
     """
     # Find CSV files
-    files = list(path.glob("*.csv")) if path.is_dir() else [path]
+    files = _list_files(path, _RE_CSV_FILE) if path.is_dir() else [path]
 
     # Filter by week if specified
     if week is not None:
@@ -681,147 +928,161 @@ def _read_sentinel_pl(  # noqa: PLR0915
         files = [p for p in files if (_extract_year_week(p)[1] in week_set)]
 
     frames: list[pl.DataFrame] = []
-    for p in sorted(files):
-        try:
-            # Read raw CSV: Row 0-1=metadata, Row 2=diseases, Row 3=count/per-sentinel, Row 4+=data
-            df_raw = pl.read_csv(
-                p, skip_rows=2, has_header=False, infer_schema_length=0, encoding="shift-jis"
-            )
-
-            if df_raw.height < 3:
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(functools.partial(_read_sentinel_file, year=year), sorted(files))
+        # Merge disease names here, in file order, rather than from the workers
+        for result in results:
+            if result is None:
                 continue
+            frame, names = result
+            frames.append(frame)
+            for raw_name, normalized in names.items():
+                _disease_name_tracker.setdefault(raw_name, normalized)
 
-            # Extract disease names from row 0 and column types from row 1
-            disease_row = df_raw.row(0)
-            type_row = df_raw.row(1)
-            data_df = df_raw.slice(2)  # Data starts from row 2
-
-            # First column is prefecture
-            first_col = df_raw.columns[0]
-            data_df = data_df.rename({first_col: "prefecture"})
-
-            # Build (disease, count_col, per_sentinel_col) tuples
-            disease_cols: list[tuple[str, str, str | None]] = []
-            current_disease: str | None = None
-            count_col: str | None = None
-
-            for i, (disease_name, col_type) in enumerate(
-                zip(disease_row[1:], type_row[1:], strict=False)
-            ):
-                original_col = df_raw.columns[i + 1]
-                if disease_name and str(disease_name).strip():
-                    # New disease
-                    current_disease = _clean_cell_text(str(disease_name))
-                    count_col = original_col
-                elif current_disease and col_type:
-                    # Per-sentinel column for current disease
-                    if count_col is not None:
-                        disease_cols.append((current_disease, count_col, original_col))
-                    current_disease = None
-                    count_col = None
-
-            # Handle last disease if no per-sentinel column
-            if current_disease and count_col:
-                disease_cols.append((current_disease, count_col, None))
-
-            # Clean prefecture names and filter totals
-            data_df = data_df.with_columns(
-                pl.col("prefecture").map_elements(
-                    lambda x: _clean_cell_text(str(x)) if x else None,
-                    return_dtype=pl.Utf8,
-                )
-            ).filter(
-                pl.col("prefecture").is_not_null() & ~pl.col("prefecture").str.contains("総数|合計")
+    if not frames:
+        return pl.DataFrame()
+    return pl.concat(frames, how="vertical", rechunk=False)
+
+
+def _read_sentinel_file(  # noqa: PLR0915
+    p: Path, *, year: int | None = None
+) -> tuple[pl.DataFrame, dict[str, str]] | None:
+    """Read a single sentinel surveillance (teitenrui) CSV file.
+
+    Args:
+        p: Path to the CSV file.
+        year: Year to assign (if None, inferred from filename).
+
+    Returns:
+        Tuple of the long-format DataFrame and the raw-to-normalized disease
+        names it contains, or None if the file has no usable data.
+    """
+    try:
+        # Read raw CSV: Row 0-1=metadata, Row 2=diseases, Row 3=count/per-sentinel, Row 4+=data.
+        # Decode Shift-JIS up front so Polars parses from its native UTF-8 path.
+        data = p.read_bytes().decode("shift-jis").encode("utf-8")
+        df_raw = pl.read_csv(data, skip_rows=2, has_header=False, infer_schema_length=0)
+
+        if df_raw.height < 3:
+            return None
+
+        # Extract disease names from row 0 and column types from row 1
+        disease_row = df_raw.row(0)
+        type_row = df_raw.row(1)
+        data_df = df_raw.slice(2)  # Data starts from row 2
+
+        # First column is prefecture
+        first_col = df_raw.columns[0]
+        data_df = data_df.rename({first_col: "prefecture"})
+
+        # Build (disease, count_col, per_sentinel_col) tuples
+        disease_cols: list[tuple[str, str, str | None]] = []
+        current_disease: str | None = None
+        count_col: str | None = None
+
+        for i, (disease_name, col_type) in enumerate(
+            zip(disease_row[1:], type_row[1:], strict=False)
+        ):
+            original_col = df_raw.columns[i + 1]
+            if disease_name and str(disease_name).strip():
+                # New disease
+                current_disease = _clean_cell_text(str(disease_name))
+                count_col = original_col
+            elif current_disease and col_type:
+                # Per-sentinel column for current disease
+                if count_col is not None:
+                    disease_cols.append((current_disease, count_col, original_col))
+                current_disease = None
+                count_col = None
+
+        # Handle last disease if no per-sentinel column
+        if current_disease and count_col:
+            disease_cols.append((current_disease, count_col, None))
+
+        # Clean prefecture names and filter totals
+        data_df = data_df.with_columns(
+            _clean_cell_text_expr(pl.col("prefecture")).alias("prefecture")
+        ).filter(
+            pl.col("prefecture").is_not_null() & ~pl.col("prefecture").str.contains("総数|合計")
+        )
+
+        # Process each disease
+        disease_frames: list[pl.DataFrame] = []
+        for disease, count_col, per_sentinel_col in disease_cols:
+            disease_df = data_df.select(["prefecture"])
+            disease_df = disease_df.with_columns(
+                [
+                    pl.lit(disease).alias("disease"),
+                    data_df[count_col].alias("count_raw")
+                    if count_col in data_df.columns
+                    else pl.lit(None).alias("count_raw"),
+                ]
             )
 
-            # Process each disease
-            disease_frames: list[pl.DataFrame] = []
-            for disease, count_col, per_sentinel_col in disease_cols:
-                disease_df = data_df.select(["prefecture"])
+            if per_sentinel_col and per_sentinel_col in data_df.columns:
                 disease_df = disease_df.with_columns(
-                    [
-                        pl.lit(disease).alias("disease"),
-                        data_df[count_col].alias("count_raw")
-                        if count_col in data_df.columns
-                        else pl.lit(None).alias("count_raw"),
-                    ]
+                    data_df[per_sentinel_col].alias("per_sentinel_raw")
                 )
+            else:
+                disease_df = disease_df.with_columns(pl.lit(None).alias("per_sentinel_raw"))
 
-                if per_sentinel_col and per_sentinel_col in data_df.columns:
-                    disease_df = disease_df.with_columns(
-                        data_df[per_sentinel_col].alias("per_sentinel_raw")
-                    )
-                else:
-                    disease_df = disease_df.with_columns(pl.lit(None).alias("per_sentinel_raw"))
+            disease_frames.append(disease_df)
 
-                disease_frames.append(disease_df)
+        if not disease_frames:
+            return None
 
-            if not disease_frames:
-                continue
+        # Concatenate all diseases for this file
+        long_df = pl.concat(disease_frames, how="vertical", rechunk=False)
 
-            # Concatenate all diseases for this file
-            long_df = pl.concat(disease_frames, how="vertical")
-
-            # Add year and week columns
-            file_year, file_week = _extract_year_week(p)
-            y = year or file_year
-            w = file_week
+        # Add year and week columns
+        file_year, file_week = _extract_year_week(p)
+        y = year or file_year
+        w = file_week
 
-            if y is not None:
-                long_df = long_df.with_columns(pl.lit(y).alias("year"))
-            if w is not None:
-                long_df = long_df.with_columns(pl.lit(w).alias("week"))
-
-            # Calculate date
-            if "year" in long_df.columns and "week" in long_df.columns:
-                long_df = long_df.with_columns(
-                    pl.struct(["year", "week"])
-                    .map_elements(
-                        lambda x: _iso_week_date(int(x["year"]), int(x["week"])),
-                        return_dtype=pl.Date,
-                    )
-                    .alias("date")
-                )
+        if y is not None:
+            long_df = long_df.with_columns(pl.lit(y).alias("year"))
+        if w is not None:
+            long_df = long_df.with_columns(pl.lit(w).alias("week"))
 
-            # Clean count and per_sentinel (replace "-" with null)
+        # Calculate date
+        if "year" in long_df.columns and "week" in long_df.columns:
             long_df = long_df.with_columns(
-                [
-                    pl.col("count_raw")
-                    .str.replace("-", "")
-                    .cast(pl.Float64, strict=False)
-                    .fill_null(0)
-                    .cast(pl.Int64)
-                    .alias("count"),
-                    pl.col("per_sentinel_raw")
-                    .str.replace("-", "")
-                    .cast(pl.Float64, strict=False)
-                    .alias("per_sentinel"),
-                ]
-            ).drop(["count_raw", "per_sentinel_raw"])
-
-            # Add source column
-            long_df = long_df.with_columns(pl.lit("Sentinel surveillance").alias("source"))
+                _iso_week_date_expr(pl.col("year"), pl.col("week")).alias("date")
+            )
 
-            # Normalize disease names
-            disease_mappings = {}
-            for raw_name in long_df["disease"].unique().to_list():
-                normalized = _normalize_disease_name(raw_name)
-                if normalized != raw_name:
-                    disease_mappings[raw_name] = normalized
-                    _disease_name_tracker[raw_name] = normalized
+        # Clean count and per_sentinel (replace "-" with null)
+        long_df = long_df.with_columns(
+            [
+                pl.col("count_raw")
+                .str.replace("-", "")
+                .cast(pl.Float64, strict=False)
+                .fill_null(0)
+                .cast(pl.Int64)
+                .alias("count"),
+                pl.col("per_sentinel_raw")
+                .str.replace("-", "")
+                .cast(pl.Float64, strict=False)
+                .alias("per_sentinel"),
+            ]
+        ).drop(["count_raw", "per_sentinel_raw"])
 
-            if disease_mappings:
-                long_df = long_df.with_columns(pl.col("disease").replace(disease_mappings))
+        # Add source column
+        long_df = long_df.with_columns(pl.lit("Sentinel surveillance").alias("source"))
 
-            frames.append(long_df)
+        # Normalize disease names
+        normalized = _normalize_disease_name_expr(pl.col("disease"))
+        names = _disease_name_pairs(
+            long_df.select("disease", normalized.alias("normalized")).filter(
+                pl.col("disease") != pl.col("normalized")
+            )
+        )
+        long_df = long_df.with_columns(normalized.alias("disease"))
 
-        except Exception:
-            logger.exception(f"Failed to parse sentinel file: {p.name}")
-            continue
+        return long_df, names
 
-    if not frames:
-        return pl.DataFrame()
-    return pl.concat(frames, how="vertical")
+    except Exception:
+        logger.exception(f"Failed to parse sentinel file: {p.name}")
+        return None
 
 
 _SENTINEL_EN_SCHEMA = {
@@ -880,19 +1141,19 @@ def _extract_year_week_sentinel_en(
     rows: list[list[str]], path: Path
 ) -> tuple[int | None, int | None]:
     """Extract year/week from English sentinel CSV header with filename fallback."""
-    year_match = re.search(r"(19|20)\d{2}", path.name)
+    year_match = _RE_YEAR.search(path.name)
     year_value = int(year_match.group(0)) if year_match else None
     week_value: int | None = None
 
     if len(rows) > 1 and rows[1]:
         header_text = ", ".join(cell.strip() for cell in rows[1] if cell and cell.strip())
-        match = re.search(r"(\d+)(?:st|nd|rd|th)\s+week,\s*(\d{4})", header_text, re.IGNORECASE)
+        match = _RE_SENTINEL_EN_WEEK.search(header_text)
         if match:
             week_value = int(match.group(1))
             year_value = int(match.group(2))
 
     if week_value is None:
-        fallback = re.search(r"teiten(?:rui)?(\d{2})", path.stem, re.IGNORECASE)
+        fallback = _RE_TEITEN_WEEK.search(path.stem)
         if fallback:
             week_value = int(fallback.group(1))
 
@@ -919,7 +1180,7 @@ def _read_sentinel_en_pl(
     week: Iterable[int] | None = None,
 ) -> pl.DataFrame:
     """Read English sentinel surveillance CSV files from /rapid/ endpoint."""
-    files = list(path.glob("*.csv")) if path.is_dir() else [path]
+    files = _list_files(path, _RE_CSV_FILE) if path.is_dir() else [path]
     week_set = {int(val) for val in week} if week is not None else None
     frames: list[pl.DataFrame] = []
 
@@ -1017,7 +1278,78 @@ def _read_sentinel_en_pl(
 
     if not frames:
         return pl.DataFrame(schema=_SENTINEL_EN_SCHEMA)
-    return pl.concat(frames, how="vertical")
+    return pl.concat(frames, how="vertical", rechunk=False)
+
+
+def _raw_out_dir(name: DatasetName, out_dir: Path | str | None) -> Path:
+    """Resolve (and create) the raw download directory for a dataset.
+
+    Args:
+        name: Dataset name.
+        out_dir: Explicit directory, or None for the system cache.
+
+    Returns:
+        Directory for raw files of this dataset.
+    """
+    if out_dir is None:
+        base_cache = Path(user_cache_dir("jp_idwr_db"))
+        if name in ("bullet", "sentinel"):
+            out_dir = base_cache / "raw" / name
+        else:
+            out_dir = base_cache / "raw" / "confirmed"
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    return out_dir
+
+
+def _download_weekly(
+    urls: list[str],
+    year_out_dir: Path,
+    *,
+    overwrite: bool,
+    skip_missing: bool = False,
+    limiter: RateLimiter | None = None,
+    max_workers: int = 1,
+) -> list[Path]:
+    """Download week-based CSV files, reusing files already on disk.
+
+    Args:
+        urls: Weekly file URLs for one year.
+        year_out_dir: Year-specific destination directory.
+        overwrite: If True, re-download files that already exist.
+        skip_missing: If True, URLs answering 404 are skipped instead of raising.
+        limiter: Rate limiter shared across batches (see `download_urls`).
+        max_workers: Maximum number of downloads in flight at once.
+
+    Returns:
+        Paths of the requested files that are available locally, in URL order.
+    """
+    config = get_config()
+    existing = {p.name: p for p in year_out_dir.glob("*.csv")}
+    needed = urls if overwrite else [url for url in urls if Path(url).name not in existing]
+    if not needed:
+        return [existing[Path(url).name] for url in urls]
+
+    downloaded = download_urls(
+        needed,
+        year_out_dir,
+        config,
+        skip_missing=skip_missing,
+        limiter=limiter,
+        max_workers=max_workers,
+        overwrite=overwrite,
+    )
+    if overwrite:
+        return downloaded
+    downloaded_map = {p.name: p for p in downloaded}
+
+    # Return all requested (existing + newly downloaded)
+    return [
+        existing[fname] if fname in existing else downloaded_map[fname]
+        for url in urls
+        if (fname := Path(url).name) in existing or fname in downloaded_map
+    ]
 
 
 def download(
@@ -1045,15 +1377,7 @@ def download(
         >>> bullet_paths = jp.download("bullet", 2024, week=[1, 2])
     """
     config = get_config()
-    if out_dir is None:
-        base_cache = Path(user_cache_dir("jp_idwr_db"))
-        if name in ("bullet", "sentinel"):
-            out_dir = base_cache / "raw" / name
-        else:
-            out_dir = base_cache / "raw" / "confirmed"
-
-    out_dir = Path(out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = _raw_out_dir(name, out_dir)
 
     if name in ("bullet", "sentinel"):
         # Week-based bullet/sentinel files reuse names each year (e.g., zensu01.csv),
@@ -1067,23 +1391,7 @@ def download(
         if not urls:
             return []
 
-        existing = {p.name: p for p in year_out_dir.glob("*.csv")}
-        if overwrite:
-            return download_urls(urls, year_out_dir, config)
-
-        needed = [url for url in urls if Path(url).name not in existing]
-        if not needed:
-            return [existing[Path(url).name] for url in urls]
-
-        downloaded = download_urls(needed, year_out_dir, config)
-        downloaded_map = {p.name: p for p in downloaded}
-
-        # Return all requested (existing + newly downloaded)
-        return [
-            existing[fname] if fname in existing else downloaded_map[fname]
-            for url in urls
-            if (fname := Path(url).name) in existing or fname in downloaded_map
-        ]
+        return _download_weekly(urls, year_out_dir, overwrite=overwrite)
 
     else:
         # Confirmed (sex or place)
@@ -1095,17 +1403,13 @@ def download(
         if dest.exists() and not overwrite:
             return dest
 
-        downloaded = download_urls([url], out_dir, config)
+        # Copy straight to the year-prefixed name; the URL basename repeats across years
+        downloaded = download_urls(
+            [url], out_dir, config, filenames={url: filename}, overwrite=overwrite
+        )
         if not downloaded:
             raise RuntimeError(f"Failed to download {name} data for year {year}")
-
-        actual_file = downloaded[0]
-        if actual_file.name != filename:
-            final_dest = out_dir / filename
-            if actual_file != final_dest:
-                actual_file.rename(final_dest)
-                return final_dest
-        return actual_file
+        return downloaded[0]
 
 
 def download_recent(
@@ -1115,8 +1419,10 @@ def download_recent(
 ) -> list[Path]:
     """Download all available bullet data (weekly reports) from 2024 onwards.
 
-    Iterates through years and weeks to fetch all available CSVs.
-    Stops fetching for a year after multiple consecutive 404s (end of data).
+    Builds every weekly URL up to the current ISO week for each year and
+    downloads them with a few requests in flight, all paced by one shared
+    rate limiter. Weeks that are not published yet (404) are skipped and
+    logged.
 
     Args:
         out_dir: Destination directory. Defaults to system cache.
@@ -1130,42 +1436,128 @@ def download_recent(
         >>> len(paths)
         52
     """
-    current_year = dt.date.today().year
-    years = range(2024, current_year + 2)
+    iso_year, iso_week, _ = dt.date.today().isocalendar()
+    base_dir = _raw_out_dir("bullet", out_dir)
 
+    # One limiter for every year keeps the whole backfill at the configured rate
+    limiter = RateLimiter(get_config().rate_limit_per_minute)
     all_files: list[Path] = []
 
-    for year in years:
-        miss_count = 0
-        year_files: list[Path] = []
+    for year in range(2024, iso_year + 1):
+        # Reports for future weeks cannot exist yet
+        last_week = min(iso_week, 52) if year == iso_year else 52
+        urls = url_bullet(year, range(1, last_week + 1))
 
-        for week in range(1, 54):
-            try:
-                paths = download(
-                    "bullet",
-                    year,
-                    out_dir=out_dir,
-                    overwrite=overwrite,
-                    week=week,
-                )
-                if paths:
-                    year_files.extend(paths if isinstance(paths, list) else [paths])
-                    miss_count = 0
-                else:
-                    miss_count += 1
-            except Exception:
-                miss_count += 1
+        year_out_dir = base_dir / str(year)
+        year_out_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            files = _download_weekly(
+                urls,
+                year_out_dir,
+                overwrite=overwrite,
+                skip_missing=True,
+                limiter=limiter,
+                max_workers=_MAX_DOWNLOAD_WORKERS,
+            )
+        except Exception:
+            logger.exception(f"Failed to download bullet data for {year}")
+            continue
 
-            # Stop if we miss too many weeks (likely future weeks)
-            if miss_count > 5:
-                break
+        found = {p.name for p in files}
+        skipped = [Path(url).name for url in urls if Path(url).name not in found]
+        if skipped:
+            logger.info(f"Skipped {len(skipped)} unpublished bullet weeks for {year}: {skipped}")
+        all_files.extend(files)
 
-        if not year_files and year > current_year:
-            break
+    return all_files
 
-        all_files.extend(year_files)
 
-    return all_files
+def _parsed_cache_enabled() -> bool:
+    """Whether parsed raw files may be cached (opt-in via ``JPINFECT_PARSED_CACHE``)."""
+    return os.getenv("JPINFECT_PARSED_CACHE", "").strip().lower() in {"1", "true", "yes"}
+
+
+def _parsed_cache_path(path: Path, type: DatasetName) -> Path:
+    """Locate the cached parse of a raw file or directory.
+
+    The key covers the package version, dataset type, resolved path and the
+    size and modification time of every source file, so editing, adding or
+    removing a raw file (or upgrading the parser) never returns a stale frame.
+
+    Args:
+        path: Raw file or directory passed to ``read``.
+        type: Dataset type used to parse it.
+
+    Returns:
+        Path of the Parquet file holding the parsed frame.
+    """
+    parts = [__version__, type, str(path.resolve())]
+    if path.is_dir():
+        with os.scandir(path) as it:
+            entries = sorted((entry for entry in it if entry.is_file()), key=lambda e: e.name)
+        for entry in entries:
+            stat = entry.stat()
+            parts.append(f"{entry.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    else:
+        stat = path.stat()
+        parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+    key = hashlib.blake2b("|".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return get_config().cache_dir / "parsed" / f"{key}.parquet"
+
+
+def _parse_raw(path: Path, type: DatasetName) -> tuple[pl.DataFrame, dict[str, str]]:
+    """Parse a raw file, returning the frame and the disease names it recorded.
+
+    Args:
+        path: Raw file or directory.
+        type: Dataset type.
+
+    Returns:
+        Tuple of the parsed frame and its raw-to-normalized disease names.
+    """
+    if type == "bullet":
+        # Bullet parsing does not record disease names
+        return _read_bullet_pl(path), {}
+    return _parse_confirmed_pl(path, type=type)
+
+
+def _read_cached(path: Path, type: DatasetName) -> pl.DataFrame:
+    """Parse a raw file, reusing an up-to-date Parquet copy of a previous parse.
+
+    Disease names recorded while parsing are stored next to the frame and
+    replayed on a hit, so ``get_disease_name_mappings`` behaves the same
+    either way. Cache failures are logged and fall back to parsing.
+
+    Args:
+        path: Raw file or directory.
+        type: Dataset type.
+
+    Returns:
+        Parsed DataFrame.
+    """
+    cache_file = _parsed_cache_path(path, type)
+    names_file = cache_file.with_suffix(".json")
+    if cache_file.exists() and names_file.exists():
+        try:
+            df = pl.read_parquet(cache_file)
+            names = json.loads(names_file.read_text(encoding="utf-8"))
+        except Exception:
+            logger.exception(f"Ignoring unreadable parsed cache {cache_file.name}")
+        else:
+            for raw_name, normalized in names.items():
+                _disease_name_tracker.setdefault(raw_name, normalized)
+            return df
+
+    df, names = _parse_raw(path, type)
+    for raw_name, normalized in names.items():
+        _disease_name_tracker.setdefault(raw_name, normalized)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        df.write_parquet(cache_file, compression="zstd", compression_level=3)
+        names_file.write_text(json.dumps(names, ensure_ascii=False), encoding="utf-8")
+    except Exception:
+        logger.exception(f"Could not cache parsed frame for {path.name}")
+    return df
 
 
 def read(
@@ -1175,7 +1567,9 @@ def read(
     """Read a local raw file into a DataFrame.
 
     Automatically detects file type (Excel vs CSV) and dataset type
-    (sex, place, bullet) from filename if not specified.
+    (sex, place, bullet) from filename if not specified. Set
+    ``JPINFECT_PARSED_CACHE=1`` to keep a Parquet copy of each parse under the
+    configured cache directory and reuse it while the source is unchanged.
 
     Args:
         path: Path to the Excel or CSV file (or directory).
@@ -1195,7 +1589,7 @@ def read(
 
     # Infer type if not specified
     if type is None:
-        if path.suffix == ".csv" or (path.is_dir() and list(path.glob("*.csv"))):
+        if path.suffix == ".csv" or (path.is_dir() and _list_files(path, _RE_CSV_FILE)):
             type = "bullet"
         elif "Syu_01" in path.name or "sex" in path.name:
             type = "sex"
@@ -1204,9 +1598,9 @@ def read(
         else:
             raise ValueError("Could not infer dataset type from filename. Please specify 'type'.")
 
-    df = _read_bullet_pl(path) if type == "bullet" else _read_confirmed_pl(path, type=type)
-
-    return df
+    if _parsed_cache_enabled():
+        return _read_cached(path, type)
+    return _read_bullet_pl(path) if type == "bullet" else _read_confirmed_pl(path, type=type)
 
 
 def get_disease_name_mappings() -> dict[str, str]:
@@ -27,8 +27,11 @@ def _infer_dataset_type(df: pl.DataFrame) -> str:
     cols = df.columns
     if "disease" in cols and "cases" in cols:
         return "long"
-    lowered = [c.lower() for c in cols]
-    if any("weekly" in c or "cumulative" in c or "total" in c for c in lowered):
+    # Lowercase lazily so the scan stops at the first matching column
+    if any(
+        "weekly" in lowered or "cumulative" in lowered or "total" in lowered
+        for lowered in map(str.lower, cols)
+    ):
         return "bullet"
     # Heuristic: sex data has groups of 3 (total/male/female)
     # place data has groups of 4 (total/japan/others/unknown)
@@ -54,15 +57,18 @@ def _col_join_rename(df: pl.DataFrame) -> pl.DataFrame:
         DataFrame with standardized column names.
     """
     dataset_type = _infer_dataset_type(df)
+    # Only columns whose name actually changes go into the rename mapping
     mapping: dict[str, str] = {}
     if dataset_type == "place":
         for name in df.columns:
-            mapping[name] = name.replace("Unknown", "Unknown place").replace(
-                "Others", "Other places"
-            )
+            if "Unknown" in name or "Others" in name:
+                mapping[name] = name.replace("Unknown", "Unknown place").replace(
+                    "Others", "Other places"
+                )
     elif dataset_type == "bullet":
         for name in df.columns:
-            mapping[name] = name.replace("weekly", "total")
+            if "weekly" in name:
+                mapping[name] = name.replace("weekly", "total")
     if mapping:
         return df.rename(mapping)
     return df
@@ -126,7 +132,7 @@ def pivot(df: pl.DataFrame) -> pl.DataFrame:
     """
     frame = df
     key_cols = ["prefecture", "year", "week", "date"]
-    cols = set(frame.columns)
+    cols = frame.columns
 
     if "disease" in cols and "cases" in cols:
         # Long -> Wide
@@ -7,20 +7,29 @@ across years and dataset types, reflecting changes in the official data structur
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import itertools
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Literal
 
-from .config import get_config
+from .config import Config, get_config
 from .http import cached_head
 
 # Base URLs for different data repositories
 BASE_KAKO = "https://idsc.niid.go.jp/idwr/CDROM/Kako/"
 BASE_YDATA = "https://id-info.jihs.go.jp/niid/images/idwr/ydata/"
 BASE_ANNUAL = "https://id-info.jihs.go.jp/surveillance/idwr/annual/"
+BASE_RAPID = "https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/"
 
+# Concurrent HEAD probes when checking which weekly files exist. HEAD requests
+# are cheap and bounded by this window, so they skip the download rate limiter
+_MAX_PROBE_WORKERS = 8
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConfirmedRule:
     """Rule for constructing confirmed cases data URLs.
 
@@ -58,12 +67,20 @@ RULES_PLACE = [
 ]
 
 
+def _confirmed_rule(year: int, type: Literal["sex", "place"]) -> ConfirmedRule | None:
+    """Find the URL rule covering a year."""
+    rules = RULES_SEX if type == "sex" else RULES_PLACE
+    return next((rule for rule in rules if rule.start <= year <= rule.end), None)
+
+
+@functools.lru_cache(maxsize=256)
 def url_confirmed(year: int, type: Literal["sex", "place"] = "sex") -> str:
     """Get the URL for confirmed cases Excel file.
 
     Constructs the URL for downloading sex-disaggregated or place-specific
     confirmed case data for a given year, accounting for historical URL
-    structure changes.
+    structure changes. Results are memoized per (year, type); call
+    ``url_confirmed.cache_clear()`` after editing ``RULES_SEX``/``RULES_PLACE``.
 
     Args:
         year: Year of the data (e.g., 2023).
@@ -80,20 +97,18 @@ def url_confirmed(year: int, type: Literal["sex", "place"] = "sex") -> str:
         >>> url_confirmed(2023, "sex")
         'https://id-info.jihs.go.jp/surveillance/idwr/annual/2023/syulist/Syu_01_1.xlsx'
     """
-    rules = RULES_SEX if type == "sex" else RULES_PLACE
-
     # Validation: place data only available from 2001
     if type == "place" and year <= 2000:
         raise ValueError("Year must be >= 2001 for place data.")
 
-    for rule in rules:
-        if rule.start <= year <= rule.end:
-            # h_year is Heisei year (year - 1988)
-            h_year = year - 1988
-            path = rule.pattern.format(year=year, h_year=h_year)
-            return f"{rule.base}{path}"
+    rule = _confirmed_rule(year, type)
+    if rule is None:
+        raise ValueError(f"No URL rule found for year {year} and type {type}")
 
-    raise ValueError(f"No URL rule found for year {year} and type {type}")
+    # h_year is Heisei year (year - 1988)
+    h_year = year - 1988
+    path = rule.pattern.format(year=year, h_year=h_year)
+    return f"{rule.base}{path}"
 
 
 def url_bullet(
@@ -139,16 +154,9 @@ def url_bullet(
     if not weeks:
         raise ValueError("Week must be between 1 and 52.")
 
-    urls: list[str] = []
-
-    for w in weeks:
-        # Always use English version
-        base = "https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/"
-        url = f"{base}{year}/{w:02d}/zensu{w:02d}.csv"
-
-        urls.append(url)
-
-    return urls
+    # Always use English version
+    base = f"{BASE_RAPID}{year}/"
+    return [f"{base}{w:02d}/zensu{w:02d}.csv" for w in weeks]
 
 
 def url_sentinel(
@@ -180,6 +188,33 @@ def url_sentinel(
         >>> url_sentinel(2025, week=4)
         ['https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/2025/04/teitenrui04.csv']
     """
+    return list(iter_sentinel_urls(year, week))
+
+
+def iter_sentinel_urls(
+    year: int,
+    week: int | Iterable[int] | None = None,
+) -> Iterator[str]:
+    """Lazily yield available sentinel URLs in week order.
+
+    Like `url_sentinel`, but URLs are yielded as soon as their week's probe
+    finishes, so callers that only need the first available week can stop
+    early. At most a few probes run ahead of the consumer.
+
+    Args:
+        year: Year of the data (must be >= 1999).
+        week: Week number(s) (1-53). If None, checks all weeks.
+
+    Returns:
+        Iterator over valid URLs for available weeks.
+
+    Raises:
+        ValueError: If year < 1999 or if week numbers are out of range.
+
+    Example:
+        >>> next(iter_sentinel_urls(2025), None)
+        'https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/2025/01/teitenrui01.csv'
+    """
     if year < 1999:
         raise ValueError("Year must be >= 1999 for sentinel data.")
 
@@ -196,33 +231,55 @@ def url_sentinel(
     if not weeks:
         raise ValueError("Week must be between 1 and 53.")
 
-    urls: list[str] = []
-
-    for w in weeks:
-        # URL patterns evolved over time.
-        if year >= 2023:
-            candidates = [
-                f"https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/{year}/{w:02d}/teitenrui{w:02d}.csv"
-            ]
-        elif year >= 2015:
-            candidates = [
-                f"https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e{year}/{year}{w:02d}/teitenrui{w:02d}.csv"
-            ]
-        else:
-            yyww = f"{year % 100:02d}{w:02d}"
-            candidates = [
-                f"https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e{year}/{yyww}/teitenrui{w:02d}.csv",
-                f"https://www.niid.go.jp/niid/images/idwr/data-e/idwr-e{year}/{yyww}/teitenrui{w:02d}.csv",
-            ]
-
-        for url in candidates:
-            # Check if URL exists
-            resp = cached_head(url, get_config())
-            if resp.status_code != 200:
-                continue
-            content_length = resp.headers.get("content-length")
-            if content_length is None or content_length == "" or int(content_length) > 0:
-                urls.append(url)
-                break
-
-    return urls
+    return _probe_weeks([_sentinel_candidates(year, w) for w in weeks], get_config())
+
+
+def _probe_weeks(candidates_by_week: list[list[str]], config: Config) -> Iterator[str]:
+    """Probe weeks concurrently, yielding each week's first available URL in order."""
+    pending = iter(candidates_by_week)
+    # Weeks are independent, so probe them concurrently; order is preserved.
+    # Submit lazily, keeping only a bounded window in flight, so that stopping
+    # early does not leave every remaining week queued.
+    executor = ThreadPoolExecutor(max_workers=min(_MAX_PROBE_WORKERS, len(candidates_by_week)))
+    try:
+        window = deque(
+            executor.submit(_first_available, candidates, config)
+            for candidates in itertools.islice(pending, _MAX_PROBE_WORKERS)
+        )
+        while window:
+            url = window.popleft().result()
+            for candidates in itertools.islice(pending, 1):
+                window.append(executor.submit(_first_available, candidates, config))
+            if url is not None:
+                yield url
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _sentinel_candidates(year: int, w: int) -> list[str]:
+    """List candidate sentinel URLs for one week, most likely first."""
+    # URL patterns evolved over time.
+    if year >= 2023:
+        return [f"{BASE_RAPID}{year}/{w:02d}/teitenrui{w:02d}.csv"]
+    if year >= 2015:
+        return [
+            f"https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e{year}/{year}{w:02d}/teitenrui{w:02d}.csv"
+        ]
+    yyww = f"{year % 100:02d}{w:02d}"
+    return [
+        f"https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e{year}/{yyww}/teitenrui{w:02d}.csv",
+        f"https://www.niid.go.jp/niid/images/idwr/data-e/idwr-e{year}/{yyww}/teitenrui{w:02d}.csv",
+    ]
+
+
+def _first_available(candidates: list[str], config: Config) -> str | None:
+    """Return the first candidate URL that exists and is non-empty, if any."""
+    for url in candidates:
+        # Check if URL exists
+        resp = cached_head(url, config)
+        if resp.status_code != 200:
+            continue
+        content_length = resp.headers.get("content-length")
+        if content_length is None or content_length == "" or int(content_length) > 0:
+            return url
+    return None
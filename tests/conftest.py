@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import os
+import shutil
+import subprocess
 from datetime import date
 from pathlib import Path
 
 import polars as pl
 import pytest
 
+try:
+    from build import ProjectBuilder
+except ImportError:
+    ProjectBuilder = None
 
-@pytest.fixture
-def local_data_dir(tmp_path: Path) -> Path:
-    data_dir = tmp_path / "data"
-    data_dir.mkdir(parents=True, exist_ok=True)
+
+@pytest.fixture(scope="session")
+def local_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Read-only for tests, so write the parquet fixtures once per session
+    data_dir = tmp_path_factory.mktemp("data")
 
     sex_df = pl.DataFrame(
         {
@@ -85,6 +93,39 @@ def local_data_dir(tmp_path: Path) -> Path:
     return data_dir
 
 
+@pytest.fixture(scope="session")
+def sex_prefecture(local_data_dir: Path) -> pl.DataFrame:
+    """Load the sex_prefecture fixture dataset once per test session."""
+    return pl.read_parquet(local_data_dir / "sex_prefecture.parquet")
+
+
+@pytest.fixture(scope="session")
+def built_wheel(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the package wheel once per test session."""
+    repo_root = Path(__file__).resolve().parents[1]
+    out_dir = tmp_path_factory.mktemp("dist")
+    # A fixed timestamp keeps the wheel reproducible unless the caller sets one
+    source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH", "1735689600")
+    if ProjectBuilder is not None:
+        builder = ProjectBuilder(repo_root)
+        # Build without isolation when the backend is already installed
+        if not builder.check_dependencies("wheel"):
+            with pytest.MonkeyPatch.context() as mp:
+                mp.setenv("SOURCE_DATE_EPOCH", source_date_epoch)
+                return Path(builder.build("wheel", out_dir))
+    if shutil.which("uv") is None:
+        pytest.skip("No wheel build backend available (install build and hatchling, or uv)")
+    subprocess.run(
+        ["uv", "build", "--wheel", "--out-dir", str(out_dir)],
+        check=True,
+        cwd=repo_root,
+        env={**os.environ, "SOURCE_DATE_EPOCH": source_date_epoch},
+    )
+    wheels = sorted(out_dir.glob("*.whl"))
+    assert wheels, "Expected a built wheel"
+    return wheels[0]
+
+
 @pytest.fixture(autouse=True)
 def patch_data_source(
     request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch, local_data_dir: Path
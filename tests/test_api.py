@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+from itertools import pairwise
+from pathlib import Path
+
 import polars as pl
+import pytest
 
 import jp_idwr_db as jp
+from jp_idwr_db import api
+
+
+def _disease_contains(df: pl.DataFrame, needle: str) -> pl.Series:
+    """Case-insensitive substring match over the disease column."""
+    return df["disease"].str.to_lowercase().str.contains(needle, literal=True)
 
 
 def test_get_data_basic() -> None:
@@ -18,46 +28,43 @@ def test_get_data_disease_filter() -> None:
     """Test filtering by disease name."""
     df = jp.get_data(disease="Tuberculosis")
     assert df.height > 0
-    assert all("tuberculosis" in d.lower() for d in df["disease"].unique().to_list())
+    assert _disease_contains(df, "tuberculosis").all(ignore_nulls=False)
 
 
 def test_get_data_multiple_diseases() -> None:
     """Test filtering by multiple diseases."""
     df = jp.get_data(disease=["Tuberculosis", "Measles"])
     assert df.height > 0
-    diseases = [d.lower() for d in df["disease"].unique().to_list()]
-    assert any("tuberculosis" in d for d in diseases)
-    assert any("measles" in d for d in diseases)
+    assert _disease_contains(df, "tuberculosis").any()
+    assert _disease_contains(df, "measles").any()
 
 
 def test_get_data_prefecture_filter() -> None:
     """Test filtering by prefecture."""
     df = jp.get_data(prefecture="Total No.")
     assert df.height > 0
-    assert df["prefecture"].unique().to_list() == ["Total No."]
+    assert (df["prefecture"] == "Total No.").all(ignore_nulls=False)
 
 
 def test_get_data_multiple_prefectures() -> None:
     """Test filtering by multiple prefectures."""
     df = jp.get_data(prefecture=["Total No.", "Hokkaido"])
     assert df.height > 0
-    prefs = df["prefecture"].unique().to_list()
-    assert set(prefs).issubset({"Total No.", "Hokkaido"})
+    assert df["prefecture"].is_in(["Total No.", "Hokkaido"]).all(ignore_nulls=False)
 
 
 def test_get_data_week_single() -> None:
     """Test filtering by single week."""
     df = jp.get_data(week=1)
     if df.height > 0:  # Only check if data exists
-        assert df["week"].unique().to_list() == [1]
+        assert (df["week"] == 1).all(ignore_nulls=False)
 
 
 def test_get_data_week_range() -> None:
     """Test filtering by week range."""
     df = jp.get_data(week=(1, 5))
     if df.height > 0:
-        weeks = df["week"].unique().sort().to_list()
-        assert all(1 <= w <= 5 for w in weeks)
+        assert df["week"].is_between(1, 5).all(ignore_nulls=False)
 
 
 def test_get_data_combined_filters() -> None:
@@ -68,9 +75,9 @@ def test_get_data_combined_filters() -> None:
         week=(1, 10),
     )
     if df.height > 0:
-        assert all("tuberculosis" in d.lower() for d in df["disease"].unique().to_list())
-        assert df["prefecture"].unique().to_list() == ["Total No."]
-        assert all(1 <= w <= 10 for w in df["week"].unique().to_list())
+        assert _disease_contains(df, "tuberculosis").all(ignore_nulls=False)
+        assert (df["prefecture"] == "Total No.").all(ignore_nulls=False)
+        assert df["week"].is_between(1, 10).all(ignore_nulls=False)
 
 
 def test_get_data_no_results() -> None:
@@ -88,7 +95,7 @@ def test_list_diseases() -> None:
     assert len(diseases) > 0
     assert all(isinstance(d, str) for d in diseases)
     # Should be sorted
-    assert diseases == sorted(diseases)
+    assert all(a <= b for a, b in pairwise(diseases))
 
 
 def test_list_diseases_all_source() -> None:
@@ -104,7 +111,7 @@ def test_list_prefectures() -> None:
     assert len(prefs) > 0
     assert all(isinstance(p, str) for p in prefs)
     # Should be sorted
-    assert prefs == sorted(prefs)
+    assert all(a <= b for a, b in pairwise(prefs))
 
 
 def test_get_latest_week() -> None:
@@ -118,3 +125,83 @@ def test_get_latest_week() -> None:
         assert isinstance(year, int)
         assert isinstance(week, int)
         assert 1 <= week <= 53
+
+
+def test_get_data_short_circuits_impossible_filters(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Filters outside the catalog return an empty frame without a full load."""
+
+    def fail_load(*_: object, **__: object) -> pl.LazyFrame:
+        raise AssertionError("scan_dataset should not be called")
+
+    monkeypatch.setattr("jp_idwr_db.api.scan_dataset", fail_load)
+    expected_cols = jp.load("unified").columns
+
+    for kwargs in (
+        {"year": (2030, 2031)},
+        {"year": 1990},
+        {"prefecture": "Tokio"},
+        {"disease": "NonexistentDisease12345"},
+    ):
+        df = jp.get_data(**kwargs)  # type: ignore[arg-type]
+        assert df.height == 0
+        assert df.columns == expected_cols
+
+
+def test_get_data_disease_filter_accepts_regex() -> None:
+    """Disease terms are regular expressions, matched case-insensitively."""
+    df = jp.get_data(disease="tuberculosis|MEASLES")
+    assert _disease_contains(df, "tuberculosis").any()
+    assert _disease_contains(df, "measles").any()
+    assert jp.get_data(disease="tuber.*sis").height > 0
+    # Uppercase escapes keep their meaning: \S is a non-space, not \s
+    df = jp.get_data(disease=r"Tuberculosi\S")
+    assert df.height > 0
+    assert _disease_contains(df, "tuberculosis").all(ignore_nulls=False)
+
+
+def test_catalog_refreshes_when_dataset_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A rewritten unified file must not be answered from a stale catalog."""
+    path = tmp_path / "unified.parquet"
+    monkeypatch.setattr(api, "_data_path", lambda name: path)
+
+    def write(diseases: list[str]) -> None:
+        n = len(diseases)
+        pl.DataFrame(
+            {"prefecture": ["Tokyo"] * n, "year": [2023] * n, "disease": diseases}
+        ).write_parquet(path)
+
+    write(["Measles"])
+    catalog = api._load_catalog()
+    assert catalog is not None
+    assert not catalog.may_match("Pertussis", None, None)
+
+    write(["Measles", "Pertussis"])
+    catalog = api._load_catalog()
+    assert catalog is not None
+    assert catalog.may_match("Pertussis", None, None)
+
+
+def test_get_data_falls_back_when_unified_fails_on_collect(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A unified file whose footer reads but whose data is corrupt uses bullet."""
+    corrupt = tmp_path / "unified.parquet"
+    pl.DataFrame({"disease": ["Tuberculosis"] * 100, "year": [2024] * 100}).write_parquet(
+        corrupt, compression="uncompressed", statistics=False
+    )
+    # Overwrite the column pages but keep the footer, so only collect() fails
+    payload = bytearray(corrupt.read_bytes())
+    pages_end = len(payload) - 8 - int.from_bytes(payload[-8:-4], "little")
+    payload[4:pages_end] = b"\xff" * (pages_end - 4)
+    corrupt.write_bytes(bytes(payload))
+    assert pl.scan_parquet(corrupt).collect_schema().names() == ["disease", "year"]
+    bullet = pl.DataFrame({"disease": ["Tuberculosis", "Measles"], "year": [2025, 2025]})
+
+    def fake_scan(name: str) -> pl.LazyFrame:
+        return pl.scan_parquet(corrupt) if name == "unified" else bullet.lazy()
+
+    monkeypatch.setattr(api, "_load_catalog", lambda: None)
+    monkeypatch.setattr(api, "scan_dataset", fake_scan)
+    assert jp.get_data(disease="tuberculosis").equals(bullet.head(1))
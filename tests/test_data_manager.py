@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 import shutil
-import subprocess
 import zipfile
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -15,12 +16,19 @@ import pytest
 from jp_idwr_db import data_manager
 
 
+def _parquet_bytes(df: pl.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    df.write_parquet(buffer)
+    return buffer.getvalue()
+
+
+# Every expected dataset gets the same placeholder table; serialize it only once
+_PLACEHOLDER_PARQUET = _parquet_bytes(pl.DataFrame({"x": [1]}))
+
+
 def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    # Fixture files are tiny, so hash them in one call rather than in chunks
+    return hashlib.sha256(path.read_bytes()).hexdigest()
 
 
 def _make_manifest_entry(path: Path, *, bad_checksum: bool = False) -> dict[str, Any]:
@@ -44,7 +52,7 @@ def _make_release_assets(tmp_path: Path, bad_checksum: bool = False) -> tuple[Pa
     parquet_paths: list[Path] = []
     for filename in sorted(data_manager.EXPECTED_DATASETS):
         parquet_path = source_dir / filename
-        pl.DataFrame({"x": [1]}).write_parquet(parquet_path)
+        parquet_path.write_bytes(_PLACEHOLDER_PARQUET)
         parquet_paths.append(parquet_path)
 
     manifest = {
@@ -64,28 +72,35 @@ def _make_release_assets(tmp_path: Path, bad_checksum: bool = False) -> tuple[Pa
     return source_dir, manifest_path
 
 
-def _make_legacy_release_assets(tmp_path: Path) -> tuple[Path, Path]:
-    source_dir = tmp_path / "legacy-source"
-    source_dir.mkdir()
-    for filename in sorted(data_manager.EXPECTED_DATASETS):
-        pl.DataFrame({"x": [1]}).write_parquet(source_dir / filename)
+def _zip_bytes(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    # Tiny fixtures: skip compression, the test only checks extraction and checksums
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as archive:
+        for arcname, payload in members.items():
+            archive.writestr(arcname, payload)
+    return buffer.getvalue()
+
+
+# The legacy archive content never varies between tests, so assemble it once
+_LEGACY_ARCHIVE_MEMBERS = dict.fromkeys(
+    sorted(data_manager.EXPECTED_DATASETS), _PLACEHOLDER_PARQUET
+)
+_LEGACY_ARCHIVE_BYTES = _zip_bytes(_LEGACY_ARCHIVE_MEMBERS)
 
+
+def _make_legacy_release_assets(tmp_path: Path) -> tuple[Path, Path]:
     archive_path = tmp_path / data_manager.ARCHIVE_NAME
-    with zipfile.ZipFile(
-        archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9
-    ) as archive:
-        for parquet in sorted(source_dir.glob("*.parquet")):
-            archive.write(parquet, arcname=parquet.name)
+    archive_path.write_bytes(_LEGACY_ARCHIVE_BYTES)
 
     manifest = {
         "archive": data_manager.ARCHIVE_NAME,
         "archive_sha256": _sha256(archive_path),
         "files": {
-            parquet.name: {
-                "sha256": _sha256(parquet),
-                "size_bytes": parquet.stat().st_size,
+            filename: {
+                "sha256": hashlib.sha256(payload).hexdigest(),
+                "size_bytes": len(payload),
             }
-            for parquet in sorted(source_dir.glob("*.parquet"))
+            for filename, payload in _LEGACY_ARCHIVE_MEMBERS.items()
         },
     }
     manifest_path = tmp_path / data_manager.LEGACY_MANIFEST_NAME
@@ -93,11 +108,8 @@ def _make_legacy_release_assets(tmp_path: Path) -> tuple[Path, Path]:
     return archive_path, manifest_path
 
 
-def test_ensure_data_downloads_and_extracts_assets(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
-) -> None:
-    source_dir, manifest_path = _make_release_assets(tmp_path)
-    cache_dir = tmp_path / "cache"
+def _fake_release_download(source_dir: Path, manifest_path: Path) -> Callable[[str, Path], None]:
+    """Serve manifest and dataset URLs from local fixture files."""
 
     def fake_download(url: str, dest: Path) -> None:
         if url.endswith(data_manager.MANIFEST_NAME):
@@ -110,7 +122,18 @@ def test_ensure_data_downloads_and_extracts_assets(
             return
         raise AssertionError(f"Unexpected URL: {url}")
 
-    monkeypatch.setattr(data_manager, "_download_file", fake_download)
+    return fake_download
+
+
+def test_ensure_data_downloads_and_extracts_assets(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    source_dir, manifest_path = _make_release_assets(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    monkeypatch.setattr(
+        data_manager, "_download_file", _fake_release_download(source_dir, manifest_path)
+    )
     monkeypatch.setenv("JPINFECT_CACHE_DIR", str(cache_dir))
 
     data_dir = data_manager.ensure_data(version="v-test", force=True)
@@ -128,18 +151,9 @@ def test_ensure_data_checksum_mismatch_raises(
     source_dir, manifest_path = _make_release_assets(tmp_path, bad_checksum=True)
     cache_dir = tmp_path / "cache"
 
-    def fake_download(url: str, dest: Path) -> None:
-        if url.endswith(data_manager.MANIFEST_NAME):
-            shutil.copyfile(manifest_path, dest)
-            return
-        filename = url.rsplit("/", maxsplit=1)[-1]
-        source_path = source_dir / filename
-        if source_path.exists():
-            shutil.copyfile(source_path, dest)
-            return
-        raise AssertionError(f"Unexpected URL: {url}")
-
-    monkeypatch.setattr(data_manager, "_download_file", fake_download)
+    monkeypatch.setattr(
+        data_manager, "_download_file", _fake_release_download(source_dir, manifest_path)
+    )
     monkeypatch.setenv("JPINFECT_CACHE_DIR", str(cache_dir))
 
     with pytest.raises(ValueError, match="Checksum mismatch"):
@@ -172,18 +186,7 @@ def test_ensure_data_supports_legacy_manifest(
     assert all((data_dir / name).exists() for name in data_manager.EXPECTED_DATASETS)
 
 
-def test_wheel_does_not_include_parquet(tmp_path: Path) -> None:
-    repo_root = Path(__file__).resolve().parents[1]
-    out_dir = tmp_path / "dist"
-    subprocess.run(
-        ["uv", "build", "--wheel", "--out-dir", str(out_dir)],
-        check=True,
-        cwd=repo_root,
-    )
-
-    wheels = sorted(out_dir.glob("*.whl"))
-    assert wheels, "Expected a built wheel"
-
-    with zipfile.ZipFile(wheels[0]) as wheel:
+def test_wheel_does_not_include_parquet(built_wheel: Path) -> None:
+    with zipfile.ZipFile(built_wheel) as wheel:
         parquet_entries = [name for name in wheel.namelist() if name.endswith(".parquet")]
     assert parquet_entries == []
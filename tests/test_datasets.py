@@ -5,16 +5,16 @@ import polars as pl
 from jp_idwr_db.datasets import load_dataset
 
 
-def test_load_dataset() -> None:
+def test_load_dataset(sex_prefecture: pl.DataFrame) -> None:
     df = load_dataset("sex_prefecture")
     assert isinstance(df, pl.DataFrame)
     assert df.height > 0
+    assert df.equals(sex_prefecture)
 
 
-def test_sex_dataset_has_three_categories() -> None:
+def test_sex_dataset_has_three_categories(sex_prefecture: pl.DataFrame) -> None:
     """Sex dataset should expose total/male/female categories."""
-    df = load_dataset("sex_prefecture")
-    cats = set(df["category"].drop_nulls().unique().to_list())
+    cats = set(sex_prefecture["category"].drop_nulls().unique().to_list())
     assert {"total", "male", "female"}.issubset(cats)
 
 
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import datetime as dt
+import logging
 from pathlib import Path
 from typing import Any
 
-from jp_idwr_db import io
+import httpx
+import pytest
+
+from jp_idwr_db import http, io
+from jp_idwr_db.config import Config
+from jp_idwr_db.urls import BASE_RAPID
 
 
 def test_download_sentinel_separates_files_by_year(tmp_path: Path, monkeypatch: Any) -> None:
@@ -15,7 +22,15 @@ def test_download_sentinel_separates_files_by_year(tmp_path: Path, monkeypatch:
         week_num = int(week) if isinstance(week, int) else 4
         return [f"https://example.invalid/{year}/{week_num:02d}/teitenrui{week_num:02d}.csv"]
 
-    def fake_download_urls(urls: list[str], dest_dir: Path, config: Any) -> list[Path]:
+    def fake_download_urls(
+        urls: list[str],
+        dest_dir: Path,
+        config: Any,
+        *,
+        skip_missing: bool = False,
+        filenames: dict[str, str] | None = None,
+        **_: Any,
+    ) -> list[Path]:
         out: list[Path] = []
         for url in urls:
             year = url.split("/")[-3]
@@ -37,3 +52,172 @@ def test_download_sentinel_separates_files_by_year(tmp_path: Path, monkeypatch:
     assert paths_2025[0].parent == tmp_path / "2025"
     assert paths_2024[0].read_text(encoding="utf-8") == "year=2024"
     assert paths_2025[0].read_text(encoding="utf-8") == "year=2025"
+
+
+def test_download_recent_batches_years_and_reports_missing_weeks(
+    tmp_path: Path, monkeypatch: Any, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Request every week up to today under one limiter, skipping unpublished ones."""
+
+    class FakeDate(dt.date):
+        @classmethod
+        def today(cls) -> FakeDate:
+            return cls(2025, 1, 8)  # ISO 2025-W02
+
+    calls: list[dict[str, Any]] = []
+
+    def fake_download_urls(
+        urls: list[str], dest_dir: Path, config: Any, **kwargs: Any
+    ) -> list[Path]:
+        calls.append({"urls": list(urls), **kwargs})
+        out: list[Path] = []
+        for url in urls:
+            if url.endswith("2025/02/zensu02.csv"):
+                continue  # Not published yet
+            path = dest_dir / Path(url).name
+            path.write_text("data", encoding="utf-8")
+            out.append(path)
+        return out
+
+    monkeypatch.setattr(io.dt, "date", FakeDate)
+    monkeypatch.setattr(io, "download_urls", fake_download_urls)
+
+    with caplog.at_level(logging.INFO, logger="jp_idwr_db.io"):
+        paths = io.download_recent(out_dir=tmp_path)
+
+    assert [len(call["urls"]) for call in calls] == [52, 2]
+    assert calls[0]["urls"][0] == f"{BASE_RAPID}2024/01/zensu01.csv"
+    assert calls[1]["urls"] == [
+        f"{BASE_RAPID}2025/01/zensu01.csv",
+        f"{BASE_RAPID}2025/02/zensu02.csv",
+    ]
+    assert all(call["skip_missing"] for call in calls)
+    assert calls[0]["limiter"] is calls[1]["limiter"]
+    assert len(paths) == 53
+    assert tmp_path / "2025" / "zensu01.csv" in paths
+    assert "Skipped 1 unpublished bullet weeks for 2025: ['zensu02.csv']" in caplog.text
+
+
+def test_download_urls_skips_missing_when_requested(tmp_path: Path, monkeypatch: Any) -> None:
+    """Treat 404 responses as absent files when skip_missing is set."""
+
+    def fake_cached_get(url: str, config: Any) -> Path:
+        if url.endswith("zensu02.csv"):
+            request = httpx.Request("GET", url)
+            response = httpx.Response(404, request=request)
+            raise httpx.HTTPStatusError("missing", request=request, response=response)
+        cached = tmp_path / "cache" / Path(url).name
+        cached.parent.mkdir(exist_ok=True)
+        cached.write_text("data", encoding="utf-8")
+        return cached
+
+    monkeypatch.setattr(http, "cached_get", fake_cached_get)
+    config = Config(cache_dir=tmp_path, rate_limit_per_minute=60_000)
+    urls = [f"https://example.invalid/{w:02d}/zensu{w:02d}.csv" for w in (1, 2, 3)]
+
+    paths = http.download_urls(urls, tmp_path / "out", config, skip_missing=True)
+    assert [p.name for p in paths] == ["zensu01.csv", "zensu03.csv"]
+    parallel = http.download_urls(urls, tmp_path / "out", config, skip_missing=True, max_workers=3)
+    assert parallel == paths
+
+    with pytest.raises(httpx.HTTPStatusError):
+        http.download_urls(urls, tmp_path / "out", config)
+
+
+def test_download_urls_keeps_current_destination_copy(tmp_path: Path, monkeypatch: Any) -> None:
+    """Skip rewriting destination files whose cached source is unchanged."""
+    cached = tmp_path / "cache" / "zensu01.csv"
+    cached.parent.mkdir()
+    cached.write_text("data", encoding="utf-8")
+
+    monkeypatch.setattr(http, "cached_get", lambda url, config: cached)
+    config = Config(cache_dir=tmp_path, rate_limit_per_minute=60_000)
+    urls = ["https://example.invalid/01/zensu01.csv"]
+
+    (dest,) = http.download_urls(urls, tmp_path / "out", config)
+    first_mtime = dest.stat().st_mtime_ns
+    (again,) = http.download_urls(urls, tmp_path / "out", config)
+    assert again == dest
+    assert dest.stat().st_mtime_ns == first_mtime
+
+    cached.write_text("new data", encoding="utf-8")
+    http.download_urls(urls, tmp_path / "out", config)
+    assert dest.read_text(encoding="utf-8") == "new data"
+
+
+def test_download_urls_overwrite_refreshes_current_looking_copy(
+    tmp_path: Path, monkeypatch: Any
+) -> None:
+    """Rewrite same-size destination files when overwriting."""
+    cached = tmp_path / "cache" / "zensu01.csv"
+    cached.parent.mkdir()
+    cached.write_text("data", encoding="utf-8")
+
+    monkeypatch.setattr(http, "cached_get", lambda url, config: cached)
+    config = Config(cache_dir=tmp_path, rate_limit_per_minute=60_000)
+    urls = ["https://example.invalid/01/zensu01.csv"]
+
+    (dest,) = http.download_urls(urls, tmp_path / "out", config)
+    dest.write_text("edit", encoding="utf-8")
+
+    http.download_urls(urls, tmp_path / "out", config)
+    assert dest.read_text(encoding="utf-8") == "edit"
+    http.download_urls(urls, tmp_path / "out", config, overwrite=True)
+    assert dest.read_text(encoding="utf-8") == "data"
+
+
+def test_download_urls_applies_filename_overrides(tmp_path: Path, monkeypatch: Any) -> None:
+    """Write overridden URLs straight to their requested destination name."""
+    cached = tmp_path / "cache" / "Syu_01_1.xlsx"
+    cached.parent.mkdir()
+    cached.write_text("data", encoding="utf-8")
+
+    monkeypatch.setattr(http, "cached_get", lambda url, config: cached)
+    config = Config(cache_dir=tmp_path, rate_limit_per_minute=60_000)
+    url = "https://example.invalid/2024/Syu_01_1.xlsx"
+
+    (dest,) = http.download_urls(
+        [url], tmp_path / "out", config, filenames={url: "2024_Syu_01_1.xlsx"}
+    )
+    assert dest == tmp_path / "out" / "2024_Syu_01_1.xlsx"
+    assert not (tmp_path / "out" / "Syu_01_1.xlsx").exists()
+
+
+def test_cached_head_reuses_responses_within_max_age(tmp_path: Path, monkeypatch: Any) -> None:
+    """Serve HEAD responses from disk until their Cache-Control max-age lapses."""
+    calls: list[str] = []
+
+    class FakeClient:
+        def head(self, url: str) -> httpx.Response:
+            calls.append(url)
+            cache_control = "max-age=60" if "fresh" in url else "no-cache"
+            return httpx.Response(
+                200,
+                headers={"cache-control": cache_control, "content-length": "5"},
+                request=httpx.Request("HEAD", url),
+            )
+
+    monkeypatch.setattr(http, "_build_client", lambda config: FakeClient())
+    config = Config(cache_dir=tmp_path)
+    fresh = "https://example.invalid/fresh.csv"
+    stale = "https://example.invalid/stale.csv"
+
+    first = http.cached_head(fresh, config)
+    again = http.cached_head(fresh, config)
+    assert again.status_code == first.status_code == 200
+    assert again.headers["content-length"] == "5"
+    http.cached_head(stale, config)
+    http.cached_head(stale, config)
+    assert calls == [fresh, stale, stale]
+
+
+def test_shared_clients_are_reused_and_closed(tmp_path: Path) -> None:
+    """Hand out one client per setting and close all of them on shutdown."""
+    config = Config(cache_dir=tmp_path)
+    client = http._build_client(config)
+    assert http._build_client(config) is client
+
+    http._close_clients()
+    assert client.is_closed
+    assert http._build_client(config) is not client
+    http._close_clients()
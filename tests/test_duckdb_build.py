@@ -22,7 +22,7 @@ def test_build_duckdb_creates_views_and_metadata(
     build_duckdb(data_dir=tmp_path, out_path=out_path)
     assert out_path.exists()
 
-    con = duckdb.connect(out_path.as_posix())
+    con = duckdb.connect(out_path.as_posix(), read_only=True)
     try:
         metadata_rows = con.execute("SELECT key, value FROM metadata ORDER BY key").fetchall()
         metadata = dict(metadata_rows)
@@ -30,15 +30,16 @@ def test_build_duckdb_creates_views_and_metadata(
         assert metadata["data_version"] == "v-test"
         assert metadata["built_at"] == "2025-01-01T00:00:00Z"
 
-        row_count = con.execute("SELECT COUNT(*) FROM unified").fetchone()
-        assert row_count is not None
-        assert row_count[0] == 3
-
-        view_sql = con.execute(
-            "SELECT sql FROM duckdb_views() WHERE view_name = 'unified'"
+        # Row count and view definition in one round trip
+        view_row = con.execute(
+            "SELECT (SELECT COUNT(*) FROM unified), "
+            "(SELECT sql FROM duckdb_views() WHERE view_name = 'unified')"
         ).fetchone()
+        assert view_row is not None
+        row_count, view_sql = view_row
+        assert row_count == 3
         assert view_sql is not None
-        assert "read_parquet('unified.parquet')" in view_sql[0]
+        assert "read_parquet('unified.parquet')" in view_sql
     finally:
         con.close()
 
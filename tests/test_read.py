@@ -6,7 +6,17 @@ from typing import Any
 import polars as pl
 import pytest
 
-from jp_idwr_db.io import read
+from jp_idwr_db import io
+from jp_idwr_db.config import Config
+from jp_idwr_db.io import (
+    _clean_cell_text,
+    _clean_cell_text_expr,
+    _iso_week_date,
+    _iso_week_date_expr,
+    _normalize_disease_name,
+    _normalize_disease_name_expr,
+    read,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -43,3 +53,70 @@ def test_read_bullet_pl() -> None:
     # Check that source column is present
     if "source" in df.columns:
         assert df["source"].unique().to_list() == ["Confirmed cases"]
+
+
+def test_clean_cell_text_expr_matches_scalar() -> None:
+    cells = [
+        "東京都(Tokyo)",
+        "\u3000北海道\uff08Hokkaido\uff09",
+        "Total\x00 No.",
+        "",
+        " ",
+        "\uff08\uff29\uff21\uff09",
+        None,
+    ]
+    df = pl.DataFrame({"cell": cells}, schema={"cell": pl.Utf8})
+    result = df.select(_clean_cell_text_expr(pl.col("cell"))).to_series().to_list()
+    assert result == [_clean_cell_text(c) for c in cells]
+
+
+def test_iso_week_date_expr_matches_scalar() -> None:
+    pairs = [(y, w) for y in range(2018, 2027) for w in range(0, 55)]
+    df = pl.DataFrame(pairs, schema={"year": pl.Int32, "week": pl.Int32}, orient="row")
+    result = df.select(_iso_week_date_expr(pl.col("year"), pl.col("week"))).to_series()
+    assert result.dtype == pl.Date
+    assert result.to_list() == [_iso_week_date(y, w) for y, w in pairs]
+
+
+def test_normalize_disease_name_expr_matches_scalar() -> None:
+    names = [
+        "H5N1) (Avian influenza H5N1",
+        "Acquired immunodeficiency syndrome  (AIDS ",
+        "Rubella ((congenital",
+        "Measles",
+        "",
+    ]
+    df = pl.DataFrame({"name": names})
+    result = df.select(_normalize_disease_name_expr(pl.col("name"))).to_series().to_list()
+    assert result == [_normalize_disease_name(n) for n in names]
+
+
+def test_csv_listing_matches_glob_and_sees_replaced_files(tmp_path: Path) -> None:
+    """List the same CSV files as glob("*.csv"), re-scanning on every call."""
+    for name in ("2024-01-zensu.csv", ".h.csv", "notes.txt", "a.csv.bak"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    listed = sorted(io._list_files(tmp_path, io._RE_CSV_FILE))
+    assert listed == sorted(tmp_path.glob("*.csv"))
+
+    # A file swapped in without any other change must still show up
+    (tmp_path / "2024-01-zensu.csv").replace(tmp_path / "2024-02-zensu.csv")
+    listed = sorted(io._list_files(tmp_path, io._RE_CSV_FILE))
+    assert listed == sorted(tmp_path.glob("*.csv"))
+
+
+def test_read_reuses_parsed_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "raw" / "2024-01-zensu.csv"
+    path.parent.mkdir()
+    path.write_bytes((FIXTURES / "2024-01-zensu.csv").read_bytes())
+
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("JPINFECT_PARSED_CACHE", "1")
+    monkeypatch.setattr(io, "get_config", lambda: Config(cache_dir=cache_dir))
+    first = read(path)
+    assert list((cache_dir / "parsed").glob("*.parquet"))
+
+    def fail(*_: object, **__: object) -> pl.DataFrame:
+        raise AssertionError("cached frame should be reused")
+
+    monkeypatch.setattr(io, "_read_bullet_pl", fail)
+    assert read(path).equals(first)
@@ -7,13 +7,12 @@ from pathlib import Path
 import polars as pl
 import pytest
 
+from jp_idwr_db import io
 from jp_idwr_db.io import _read_sentinel_pl, _sentinel_cumulative_to_weekly
 
-
-@pytest.fixture
-def sample_sentinel_csv(tmp_path: Path) -> Path:
-    """Create a minimal sentinel CSV file for testing."""
-    content = """報告数・定点当り報告数、疾病・都道府県別,"","","","",""
+# Encoded once at import; every test reads the same Shift-JIS bytes
+_SENTINEL_CSV_BYTES = """\
+報告数・定点当り報告数、疾病・都道府県別,"","","","",""
 2025年04週(01月20日〜01月26日),"2025年01月29日作成","","","","",""
 ,"インフルエンザ","","ＲＳウイルス感染症","","咽頭結膜熱",""
 ,"報告","定当","報告","定当","報告","定当"
@@ -21,17 +20,26 @@ def sample_sentinel_csv(tmp_path: Path) -> Path:
 "北海道","1794","8.08","234","1.72","47","0.35"
 "青森県","567","9.78","8","0.22","13","0.35"
 "岩手県","749","12.08","11","0.28","20","0.51"
-"""
+""".encode("shift-jis")
+
 
-    # Write as Shift-JIS
-    csv_path = tmp_path / "2025-04-teiten.csv"
-    csv_path.write_bytes(content.encode("shift-jis"))
+@pytest.fixture(scope="module")
+def sample_sentinel_csv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a minimal sentinel CSV file for testing."""
+    csv_path = tmp_path_factory.mktemp("sentinel") / "2025-04-teiten.csv"
+    csv_path.write_bytes(_SENTINEL_CSV_BYTES)
     return csv_path
 
 
-def test_read_sentinel_basic(sample_sentinel_csv: Path) -> None:
+@pytest.fixture(scope="module")
+def parsed_sentinel(sample_sentinel_csv: Path) -> pl.DataFrame:
+    """Parse the sample CSV once; the tests below only inspect the result."""
+    return _read_sentinel_pl(sample_sentinel_csv)
+
+
+def test_read_sentinel_basic(parsed_sentinel: pl.DataFrame) -> None:
     """Test basic sentinel data parsing."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Check basic structure
     assert isinstance(df, pl.DataFrame)
@@ -54,9 +62,9 @@ def test_read_sentinel_basic(sample_sentinel_csv: Path) -> None:
     assert df["source"].unique().to_list() == ["Sentinel surveillance"]
 
 
-def test_read_sentinel_schema(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_schema(parsed_sentinel: pl.DataFrame) -> None:
     """Test that sentinel data has correct schema."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Check data types
     assert df["prefecture"].dtype == pl.Utf8
@@ -69,9 +77,9 @@ def test_read_sentinel_schema(sample_sentinel_csv: Path) -> None:
     assert df["source"].dtype == pl.Utf8
 
 
-def test_read_sentinel_diseases(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_diseases(parsed_sentinel: pl.DataFrame) -> None:
     """Test that diseases are correctly extracted."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     diseases = df["disease"].unique().sort().to_list()
     # Should have extracted diseases from the CSV
@@ -80,9 +88,9 @@ def test_read_sentinel_diseases(sample_sentinel_csv: Path) -> None:
     assert all(d for d in diseases)
 
 
-def test_read_sentinel_prefectures(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_prefectures(parsed_sentinel: pl.DataFrame) -> None:
     """Test that prefectures are correctly extracted and filtered."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     prefectures = df["prefecture"].unique().to_list()
     # Should not include "総数" (totals)
@@ -92,9 +100,9 @@ def test_read_sentinel_prefectures(sample_sentinel_csv: Path) -> None:
     assert len(prefectures) > 0
 
 
-def test_read_sentinel_per_sentinel_metrics(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_per_sentinel_metrics(parsed_sentinel: pl.DataFrame) -> None:
     """Test that per-sentinel metrics are captured."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Check that per_sentinel column has values
     assert "per_sentinel" in df.columns
@@ -103,9 +111,9 @@ def test_read_sentinel_per_sentinel_metrics(sample_sentinel_csv: Path) -> None:
     assert non_null_count > 0
 
 
-def test_read_sentinel_year_week(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_year_week(parsed_sentinel: pl.DataFrame) -> None:
     """Test that year and week are correctly inferred from filename."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Year and week should be inferred from filename "2025-04-teiten.csv"
     # Actually, the test CSV header says "2025年04週" but the filename extraction
@@ -123,9 +131,9 @@ def test_read_sentinel_empty_directory(tmp_path: Path) -> None:
     assert df.height == 0
 
 
-def test_read_sentinel_date_calculation(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_date_calculation(parsed_sentinel: pl.DataFrame) -> None:
     """Test that dates are correctly calculated from year/week."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Check that date column exists and has values
     assert "date" in df.columns
@@ -134,23 +142,43 @@ def test_read_sentinel_date_calculation(sample_sentinel_csv: Path) -> None:
     assert df["date"].null_count() == 0
 
 
-def test_read_sentinel_count_parsing(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_count_parsing(parsed_sentinel: pl.DataFrame) -> None:
     """Test that counts are correctly parsed as integers."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Counts should be non-negative integers
     assert df["count"].dtype == pl.Int64
     assert (df["count"] >= 0).all()
 
 
-def test_read_sentinel_normalization(sample_sentinel_csv: Path) -> None:
+def test_read_sentinel_normalization(parsed_sentinel: pl.DataFrame) -> None:
     """Test that disease names are normalized."""
-    df = _read_sentinel_pl(sample_sentinel_csv)
+    df = parsed_sentinel
 
     # Disease names should not be empty
-    assert all(df["disease"].str.len_chars() > 0)
+    assert (df["disease"].str.len_chars() > 0).all(ignore_nulls=False)
     # Should not have leading/trailing whitespace
-    assert all(df["disease"] == df["disease"].str.strip_chars())
+    assert (df["disease"] == df["disease"].str.strip_chars()).all(ignore_nulls=False)
+
+
+def test_read_sentinel_merges_disease_names_on_caller(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Workers return their name mappings; only the caller updates the tracker."""
+    tracker: dict[str, str] = {}
+    monkeypatch.setattr(io, "_disease_name_tracker", tracker)
+    raw = _SENTINEL_CSV_BYTES.replace("インフルエンザ".encode("shift-jis"), b"HIV/AIDS")
+    for week in ("04", "05"):
+        (tmp_path / f"2025-{week}-teiten.csv").write_bytes(raw)
+
+    result = io._read_sentinel_file(tmp_path / "2025-04-teiten.csv")
+    assert result is not None
+    assert result[1] == {"HIV/AIDS": "AIDS"}
+    assert tracker == {}
+
+    df = _read_sentinel_pl(tmp_path)
+    assert df.height == 2 * result[0].height
+    assert tracker == {"HIV/AIDS": "AIDS"}
 
 
 def test_sentinel_cumulative_to_weekly_basic_diff() -> None:
@@ -1,119 +1,127 @@
 from __future__ import annotations
 
-import typing
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
 from jp_idwr_db import urls
 
+# Expected URLs spell out the path literally; only the host prefixes are shared
+_RAPID_BASE = "https://id-info.jihs.go.jp/en/surveillance/idwr/rapid"
+_ARCHIVE_BASE = "https://id-info.jihs.go.jp/niid/images/idwr/data-e"
 
-def test_url_confirmed_sex_2010() -> None:
-    url = urls.url_confirmed(2010, "sex")
-    assert url.endswith("H22/Syuukei/Syu_01_1.xls")
 
+_OK_RESPONSE = SimpleNamespace(status_code=200, headers={"content-length": "100"})
 
-def test_url_confirmed_place_2006() -> None:
-    url = urls.url_confirmed(2006, "place")
-    assert url.endswith("H18/Syuukei/Syu_02_1.xls")
-
-
-def test_url_bullet_en(monkeypatch: Any) -> None:
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
-
-        return Resp()
-
-    monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_bullet(2025, 1)
-    assert result == ["https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/2025/01/zensu01.csv"]
 
+@pytest.fixture(scope="module", autouse=True)
+def patched_head() -> Iterator[None]:
+    """Answer every availability probe in this module with the same 200 response.
 
-def test_url_bullet_ja(monkeypatch: Any) -> None:
-    """Test English bullet URL generation (no Japanese option now)."""
-
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
-
-        return Resp()
-
-    monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_bullet(2025, 11)
-    # Now always returns English version
-    assert result == ["https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/2025/11/zensu11.csv"]
-
-
-def test_url_sentinel_single_week(monkeypatch: Any) -> None:
-    """Test sentinel URL generation for a single week."""
-
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
-
-        return Resp()
-
-    monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_sentinel(2025, 4)
-    assert result == [
-        "https://id-info.jihs.go.jp/en/surveillance/idwr/rapid/2025/04/teitenrui04.csv"
-    ]
+    Installed once per module; tests that need other statuses patch over it.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(urls, "cached_head", lambda url, config: _OK_RESPONSE)
+        yield
 
 
-def test_url_sentinel_2022_archive_format(monkeypatch: Any) -> None:
-    """Test sentinel URL generation for 2015-2022 archive pattern."""
+def test_url_confirmed_sex_2010() -> None:
+    url = urls.url_confirmed(2010, "sex")
+    assert url.endswith("H22/Syuukei/Syu_01_1.xls")
 
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
 
-        return Resp()
+def test_url_confirmed_place_2006() -> None:
+    url = urls.url_confirmed(2006, "place")
+    assert url.endswith("H18/Syuukei/Syu_02_1.xls")
 
-    monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_sentinel(2022, 50)
-    assert result == [
-        "https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e2022/202250/teitenrui50.csv"
-    ]
 
+@pytest.mark.parametrize(
+    ("week", "expected"),
+    [
+        (1, f"{_RAPID_BASE}/2025/01/zensu01.csv"),
+        (11, f"{_RAPID_BASE}/2025/11/zensu11.csv"),
+    ],
+)
+def test_url_bullet(week: int, expected: str) -> None:
+    """Bullet URLs always point at the English rapid-report files."""
+    assert urls.url_bullet(2025, week) == [expected]
+
+
+@pytest.mark.parametrize(
+    ("year", "week", "expected"),
+    [
+        pytest.param(2025, 4, f"{_RAPID_BASE}/2025/04/teitenrui04.csv", id="rapid"),
+        pytest.param(
+            2022, 50, f"{_ARCHIVE_BASE}/idwr-e2022/202250/teitenrui50.csv", id="archive-2015-2022"
+        ),
+        pytest.param(
+            2014, 47, f"{_ARCHIVE_BASE}/idwr-e2014/1447/teitenrui47.csv", id="archive-pre-2015"
+        ),
+    ],
+)
+def test_url_sentinel_single_week(year: int, week: int, expected: str) -> None:
+    """Test sentinel URL generation for a single week in each URL scheme."""
+    assert urls.url_sentinel(year, week) == [expected]
+
+
+def test_url_sentinel_multiple_weeks() -> None:
+    """Test sentinel URL generation for multiple weeks."""
+    result = urls.url_sentinel(2025, [1, 2, 3])
+    assert len(result) == 3
+    assert all("teitenrui" in url for url in result)
+    assert result[0].endswith("2025/01/teitenrui01.csv")
+    assert result[2].endswith("2025/03/teitenrui03.csv")
 
-def test_url_sentinel_2014_archive_format(monkeypatch: Any) -> None:
-    """Test sentinel URL generation for pre-2015 archive pattern."""
 
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
+def test_iter_sentinel_urls_skips_missing_weeks_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Yield only available weeks, in week order, and validate eagerly."""
 
-        return Resp()
+    def fake_head(url: str, config: Any) -> SimpleNamespace:
+        status_code = 404 if "teitenrui02" in url else 200
+        return SimpleNamespace(status_code=status_code, headers={"content-length": "100"})
 
     monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_sentinel(2014, 47)
-    assert result == [
-        "https://id-info.jihs.go.jp/niid/images/idwr/data-e/idwr-e2014/1447/teitenrui47.csv"
-    ]
+    result = urls.iter_sentinel_urls(2025, [1, 2, 3])
+    assert next(result).endswith("2025/01/teitenrui01.csv")
+    assert next(result).endswith("2025/03/teitenrui03.csv")
+    assert next(result, None) is None
 
+    with pytest.raises(ValueError, match="Year must be >= 1999 for sentinel data"):
+        urls.iter_sentinel_urls(1998, 1)
 
-def test_url_sentinel_multiple_weeks(monkeypatch: Any) -> None:
-    """Test sentinel URL generation for multiple weeks."""
 
-    def fake_head(url: str, config: Any) -> Any:
-        class Resp:
-            status_code = 200
-            headers: typing.ClassVar = {"content-length": "100"}
+def test_iter_sentinel_urls_probes_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep only a bounded window of probes ahead of the consumer."""
+    probed: list[str] = []
 
-        return Resp()
+    def fake_head(url: str, config: Any) -> SimpleNamespace:
+        probed.append(url)
+        return _OK_RESPONSE
 
     monkeypatch.setattr(urls, "cached_head", fake_head)
-    result = urls.url_sentinel(2025, [1, 2, 3])
-    assert len(result) == 3
-    assert all("teitenrui" in url for url in result)
-    assert result[0].endswith("2025/01/teitenrui01.csv")
-    assert result[2].endswith("2025/03/teitenrui03.csv")
+    result = urls.iter_sentinel_urls(2025)
+    assert next(result).endswith("2025/01/teitenrui01.csv")
+    assert len(probed) <= urls._MAX_PROBE_WORKERS + 1
+
+
+def test_url_sentinel_probes_overlap_round_trips(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A window of probes finishes in about one round trip, not one per week."""
+    round_trip = 0.2
+
+    def slow_head(url: str, config: Any) -> SimpleNamespace:
+        time.sleep(round_trip)
+        return _OK_RESPONSE
+
+    monkeypatch.setattr(urls, "cached_head", slow_head)
+    weeks = range(1, urls._MAX_PROBE_WORKERS + 1)
+    start = time.perf_counter()
+    result = urls.url_sentinel(2025, weeks)
+    elapsed = time.perf_counter() - start
+    assert len(result) == len(weeks)
+    assert elapsed < 2 * round_trip
 
 
 def test_url_sentinel_validation() -> None: